@@ -0,0 +1,346 @@
+"""
+Registro de motores de cálculo (backends) para aplicar operadores y medir estados.
+
+Backends incluidos:
+    "python": implementación de referencia en Python puro (siempre disponible)
+    "numpy":  operaciones vectorizadas con NumPy (si está instalado)
+    "numba":  núcleos compilados JIT con Numba (si está instalado)
+
+Las dependencias opcionales sólo se importan al usar el backend por primera vez.
+El backend se puede elegir globalmente con `establecer_backend` o en cada llamada
+pasando `backend=` a `OperadorCuantico.aplicar` o `EstadoCuantico.medir`.
+"""
+
+import importlib.util
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+def desplazamientos_qubits(qubits: Sequence[int], n: int) -> List[int]:
+    """
+    Devuelve, para cada valor s de los k qubits indicados, el desplazamiento que
+    suma al índice global (el bit más significativo de s corresponde a qubits[0]).
+    """
+    k = len(qubits)
+    posiciones = [n - 1 - q for q in qubits]
+    desplazamientos = []
+    for s in range(1 << k):
+        desplazamiento = 0
+        for j, pos in enumerate(posiciones):
+            if s >> (k - 1 - j) & 1:
+                desplazamiento |= 1 << pos
+        desplazamientos.append(desplazamiento)
+    return desplazamientos
+
+def conjugar_plano(backend, matriz: Sequence[Sequence[complex]], plano, qubits: Sequence[int], n: int) -> None:
+    """
+    Aplica K ⊗ conj(K) en el sitio sobre el vector plano (2n qubits) de una matriz
+    densidad de n qubits, con el núcleo en el sitio del backend indicado.
+    """
+    conjugada = [[complex(c).conjugate() for c in fila] for fila in matriz]
+    backend.aplicar_matriz_local_en_sitio(matriz, plano, list(qubits), 2 * n)
+    backend.aplicar_matriz_local_en_sitio(conjugada, plano, [n + q for q in qubits], 2 * n)
+
+class BackendPython:
+    """Implementación de referencia en Python puro."""
+
+    nombre = "python"
+    # Si sus núcleos trabajan sobre arrays complex128 de NumPy (y no sobre listas)
+    vectorial = False
+
+    @staticmethod
+    def disponible() -> bool:
+        return True
+
+    def __init__(self):
+        # Búferes auxiliares de 2^k amplitudes para la aplicación en el sitio, por tamaño
+        self._bloques: Dict[int, List[complex]] = {}
+
+    def aplicar_matriz(self, matriz: Sequence[Sequence[complex]], vector: Sequence[complex]) -> List[complex]:
+        """Multiplicación matriz-vector completa."""
+        nuevo_vector = []
+        for fila in matriz:
+            componente = sum(f * v for f, v in zip(fila, vector))
+            nuevo_vector.append(componente)
+        return nuevo_vector
+
+    def aplicar_matriz_local(self, matriz: Sequence[Sequence[complex]], vector: Sequence[complex],
+                             qubits: Sequence[int], n: int) -> List[complex]:
+        """Aplica una matriz de k qubits sobre los qubits indicados: O(2^n * 2^k)."""
+        desplazamientos = desplazamientos_qubits(qubits, n)
+        mascara = desplazamientos[-1]
+
+        nuevo_vector = list(vector)
+        for base in range(len(vector)):
+            if base & mascara:
+                continue
+            indices = [base | d for d in desplazamientos]
+            bloque = [vector[i] for i in indices]
+            for i, fila in zip(indices, matriz):
+                nuevo_vector[i] = sum(f * v for f, v in zip(fila, bloque))
+        return nuevo_vector
+
+    def aplicar_matriz_local_en_sitio(self, matriz: Sequence[Sequence[complex]], vector: List[complex],
+                                      qubits: Sequence[int], n: int) -> None:
+        """
+        Como `aplicar_matriz_local`, pero sobrescribe `vector` sin reservar otro de 2^n.
+
+        Sólo usa un búfer auxiliar de 2^k amplitudes, que se reutiliza entre llamadas.
+        """
+        if len(qubits) == 1:
+            # Caso más común (puerta de un qubit): recorrer directamente los pares (i0, i1)
+            (m00, m01), (m10, m11) = matriz
+            bit = 1 << (n - 1 - qubits[0])
+            for alto in range(0, len(vector), bit << 1):
+                for i0 in range(alto, alto + bit):
+                    i1 = i0 | bit
+                    a0 = vector[i0]
+                    a1 = vector[i1]
+                    vector[i0] = m00 * a0 + m01 * a1
+                    vector[i1] = m10 * a0 + m11 * a1
+            return
+
+        desplazamientos = desplazamientos_qubits(qubits, n)
+        mascara = desplazamientos[-1]
+        bloque = self._bloques.get(len(desplazamientos))
+        if bloque is None:
+            bloque = self._bloques[len(desplazamientos)] = [0j] * len(desplazamientos)
+        for base in range(len(vector)):
+            if base & mascara:
+                continue
+            for s, desplazamiento in enumerate(desplazamientos):
+                bloque[s] = vector[base | desplazamiento]
+            for desplazamiento, fila in zip(desplazamientos, matriz):
+                vector[base | desplazamiento] = sum(f * v for f, v in zip(fila, bloque))
+
+    def probabilidades(self, vector: Sequence[complex]) -> List[float]:
+        """Probabilidad |a|^2 de cada amplitud."""
+        return [abs(amplitud)**2 for amplitud in vector]
+
+    def copiar_vector(self, vector: Sequence[complex]) -> List[complex]:
+        """Copia de trabajo de un vector, en el formato que mejor procesa el backend."""
+        return [complex(a) for a in vector]
+
+    def aplicar_kraus_local(self, matrices: Sequence[Sequence[Sequence[complex]]], rho: Sequence[Sequence[complex]],
+                            qubits: Sequence[int], n: int) -> List[List[complex]]:
+        """
+        Calcula sum_k K_k rho K_k† tratando rho (2^n x 2^n, por filas) como un vector plano de 2n qubits.
+
+        El qubit q de las filas es el qubit q del vector plano y el de las columnas, el
+        n + q: basta aplicar en el sitio K sobre los primeros y conj(K) sobre los segundos.
+        """
+        dimension = 1 << n
+        original = [c for fila in rho for c in fila]
+        total = None
+        for i, matriz in enumerate(matrices):
+            plano = original if i == len(matrices) - 1 else list(original)
+            conjugar_plano(self, matriz, plano, qubits, n)
+            total = plano if total is None else [a + b for a, b in zip(total, plano)]
+        return [total[i:i + dimension] for i in range(0, len(total), dimension)]
+
+class BackendNumpy:
+    """Operaciones vectorizadas con NumPy (contracción tensorial para puertas locales)."""
+
+    nombre = "numpy"
+    vectorial = True
+
+    @staticmethod
+    def disponible() -> bool:
+        return importlib.util.find_spec("numpy") is not None
+
+    def __init__(self):
+        import numpy
+        self.np = numpy
+        self._auxiliares: Dict[tuple, object] = {}
+        # Núcleo en el sitio para listas de Python (ver `aplicar_matriz_local_en_sitio`)
+        self._python = BackendPython()
+
+    def aplicar_matriz(self, matriz, vector) -> List[complex]:
+        np = self.np
+        return (np.asarray(matriz, dtype=np.complex128) @ np.asarray(vector, dtype=np.complex128)).tolist()
+
+    def aplicar_matriz_local(self, matriz, vector, qubits: Sequence[int], n: int) -> List[complex]:
+        np = self.np
+        k = len(qubits)
+        tensor = np.asarray(vector, dtype=np.complex128).reshape((2,) * n)
+        puerta = np.asarray(matriz, dtype=np.complex128).reshape((2,) * (2 * k))
+        # Contraer los índices de entrada de la puerta con los ejes de los qubits destino
+        resultado = np.tensordot(puerta, tensor, axes=(list(range(k, 2 * k)), list(qubits)))
+        # tensordot deja los ejes de salida de la puerta al principio: devolverlos a su sitio
+        resultado = np.moveaxis(resultado, list(range(k)), list(qubits))
+        return resultado.reshape(-1).tolist()
+
+    def aplicar_matriz_local_en_sitio(self, matriz, vector, qubits: Sequence[int], n: int) -> None:
+        """
+        Sobrescribe `vector` con el resultado. Con arrays de NumPy, el resultado se
+        calcula en un búfer auxiliar reutilizado entre puertas del mismo tamaño.
+
+        Con listas de Python se usa el núcleo de `BackendPython`: convertirlas
+        reservaría un array, un resultado y una lista nuevos de 2^n en cada puerta.
+        """
+        np = self.np
+        if not isinstance(vector, np.ndarray):
+            self._python.aplicar_matriz_local_en_sitio(matriz, vector, qubits, n)
+            return
+        k = len(qubits)
+        auxiliar = self._auxiliares.get(vector.shape)
+        if auxiliar is None:
+            auxiliar = self._auxiliares[vector.shape] = np.empty(vector.shape, dtype=np.complex128)
+        puerta = np.asarray(matriz, dtype=np.complex128).reshape((2,) * (2 * k))
+        tensor = vector.reshape((2,) * n)
+        destino = np.moveaxis(auxiliar.reshape((2,) * n), list(qubits), list(range(k)))
+        np.einsum(puerta, list(range(n, n + k)) + list(qubits),
+                  tensor, list(range(n)),
+                  list(range(n, n + k)) + [q for q in range(n) if q not in qubits],
+                  out=destino)
+        vector[:] = auxiliar
+
+    def probabilidades(self, vector) -> List[float]:
+        np = self.np
+        amplitudes = np.asarray(vector, dtype=np.complex128)
+        return (amplitudes.real**2 + amplitudes.imag**2).tolist()
+
+    def copiar_vector(self, vector):
+        np = self.np
+        return np.array(vector, dtype=np.complex128)
+
+    def aplicar_kraus_local(self, matrices, rho, qubits: Sequence[int], n: int) -> List[List[complex]]:
+        """Como en `BackendPython`, pero sobre arrays de NumPy de 4^n amplitudes."""
+        np = self.np
+        original = np.array(rho, dtype=np.complex128).reshape(-1)
+        total = None
+        for i, matriz in enumerate(matrices):
+            plano = original if i == len(matrices) - 1 else original.copy()
+            conjugar_plano(self, matriz, plano, qubits, n)
+            if total is None:
+                total = plano
+            else:
+                total += plano
+        return total.reshape(1 << n, 1 << n).tolist()
+
+class BackendNumba(BackendNumpy):
+    """Núcleos compilados JIT con Numba; hereda de NumPy lo que no necesita compilarse."""
+
+    nombre = "numba"
+
+    @staticmethod
+    def disponible() -> bool:
+        return (importlib.util.find_spec("numba") is not None
+                and importlib.util.find_spec("numpy") is not None)
+
+    def __init__(self):
+        super().__init__()
+        import numba
+        import numpy as np
+
+        @numba.njit
+        def nucleo_local_en_sitio(puerta, vector, desplazamientos, mascara, bloque):
+            d = desplazamientos.shape[0]
+            for base in range(vector.shape[0]):
+                if base & mascara:
+                    continue
+                for s in range(d):
+                    bloque[s] = vector[base | desplazamientos[s]]
+                for f in range(d):
+                    total = 0j
+                    for c in range(d):
+                        total += puerta[f, c] * bloque[c]
+                    vector[base | desplazamientos[f]] = total
+
+        self._nucleo_local_en_sitio = nucleo_local_en_sitio
+
+    def _aplicar_nucleo(self, matriz, vector, qubits: Sequence[int], n: int) -> None:
+        """Ejecuta el núcleo JIT sobre un array complex128 contiguo, modificándolo."""
+        np = self.np
+        desplazamientos = np.asarray(desplazamientos_qubits(qubits, n), dtype=np.int64)
+        self._nucleo_local_en_sitio(np.asarray(matriz, dtype=np.complex128), vector, desplazamientos,
+                                    int(desplazamientos[-1]), np.empty(len(desplazamientos), dtype=np.complex128))
+
+    def aplicar_matriz_local(self, matriz, vector, qubits: Sequence[int], n: int) -> List[complex]:
+        np = self.np
+        nuevo = np.array(vector, dtype=np.complex128)
+        self._aplicar_nucleo(matriz, nuevo, qubits, n)
+        return nuevo.tolist()
+
+    def aplicar_matriz_local_en_sitio(self, matriz, vector, qubits: Sequence[int], n: int) -> None:
+        """
+        Con arrays complex128 contiguos, el núcleo JIT modifica el array directamente
+        (sólo reserva un bloque de 2^k amplitudes). Con listas u otros arrays se
+        delega en `BackendNumpy`.
+        """
+        np = self.np
+        if (isinstance(vector, np.ndarray) and vector.dtype == np.complex128
+                and vector.flags.c_contiguous and vector.flags.writeable):
+            self._aplicar_nucleo(matriz, vector, qubits, n)
+        else:
+            super().aplicar_matriz_local_en_sitio(matriz, vector, qubits, n)
+
+# Registro: nombre -> clase del backend (las instancias se crean al usarse por primera vez)
+_REGISTRO: Dict[str, Callable] = {}
+_INSTANCIAS: Dict[str, object] = {}
+_PREFERENCIA = ["numba", "numpy", "python"]
+_backend_actual = "python"
+
+def registrar_backend(nombre: str, fabrica: Callable) -> None:
+    """
+    Registra un backend nuevo (o reemplaza uno existente).
+
+    Args:
+        nombre: Nombre con el que se seleccionará el backend
+        fabrica: Clase o función sin argumentos que crea el backend. Si tiene un
+            método estático `disponible()`, se usa para comprobar sus dependencias.
+    """
+    _REGISTRO[nombre] = fabrica
+    _INSTANCIAS.pop(nombre, None)
+
+def backends_disponibles() -> List[str]:
+    """Nombres de los backends registrados cuyas dependencias están instaladas."""
+    return [nombre for nombre, fabrica in _REGISTRO.items()
+            if getattr(fabrica, "disponible", lambda: True)()]
+
+def obtener_backend(backend: Union[str, object, None] = None):
+    """
+    Devuelve la instancia de un backend.
+
+    Args:
+        backend: Nombre del backend, "auto" (el más rápido disponible), una instancia
+            ya creada, o None para usar el backend global
+
+    Raises:
+        ValueError: Si el backend no existe o sus dependencias no están instaladas
+    """
+    if backend is not None and not isinstance(backend, str):
+        return backend
+    nombre = _resolver_nombre(backend)
+    if nombre not in _INSTANCIAS:
+        _INSTANCIAS[nombre] = _REGISTRO[nombre]()
+    return _INSTANCIAS[nombre]
+
+def _resolver_nombre(backend: Optional[str]) -> str:
+    """Traduce None/"auto" a un nombre concreto y comprueba que esté disponible."""
+    if backend is None:
+        return _backend_actual
+    disponibles = backends_disponibles()
+    if backend == "auto":
+        return next(n for n in _PREFERENCIA + list(_REGISTRO) if n in disponibles)
+    if backend not in _REGISTRO:
+        raise ValueError(f"Backend desconocido: '{backend}'. Registrados: {', '.join(_REGISTRO)}")
+    if backend not in disponibles:
+        raise ValueError(f"El backend '{backend}' no está disponible (faltan dependencias)")
+    return backend
+
+def establecer_backend(nombre: str) -> None:
+    """
+    Selecciona el backend global ("python", "numpy", "numba", "auto" o uno registrado).
+
+    Raises:
+        ValueError: Si el backend no existe o no está disponible
+    """
+    global _backend_actual
+    _backend_actual = _resolver_nombre(nombre)
+
+def backend_actual() -> str:
+    """Nombre del backend global."""
+    return _backend_actual
+
+registrar_backend("python", BackendPython)
+registrar_backend("numpy", BackendNumpy)
+registrar_backend("numba", BackendNumba)
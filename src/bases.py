@@ -0,0 +1,173 @@
+"""
+Cambios de base para vectores de estado.
+
+Cada qubit puede estar expresado en la base computacional (Z: |0>, |1>), en la de
+Hadamard (X: |+>, |->) o en la circular (Y: |+i>, |-i>). Una base se indica con:
+
+    - un nombre que se aplica a todos los qubits: "computacional", "hadamard" o "circular"
+      (también "z", "x" e "y")
+    - una cadena con una letra por qubit, empezando por el qubit 0 (ej. "ZXY")
+
+Los cambios se hacen en el sitio con una transformada rápida de Walsh-Hadamard
+sobre los qubits afectados y, para la base Y, una fase diagonal: O(n * 2^n)
+operaciones y ninguna matriz de 2^n x 2^n.
+"""
+
+from typing import List, Optional, Sequence
+from observables import numero_qubits
+from backends import obtener_backend
+
+BASES = {"computacional": "Z", "hadamard": "X", "circular": "Y", "z": "Z", "x": "X", "y": "Y"}
+_NOMBRES = {"Z": "computacional", "X": "hadamard", "Y": "circular"}
+_H = 2 ** -0.5
+# Vectores de cada base por columnas: V_Z = I, V_X = H, V_Y = S H
+_VECTORES = {"Z": [[1, 0], [0, 1]], "X": [[_H, _H], [_H, -_H]], "Y": [[_H, _H], [1j * _H, -1j * _H]]}
+
+def bases_por_qubit(base: str, n: int) -> str:
+    """
+    Traduce una base a una cadena con una letra (Z, X o Y) por qubit.
+
+    Raises:
+        ValueError: Si la base no es un nombre conocido ni una cadena de n letras Z/X/Y
+    """
+    letra = BASES.get(base.lower())
+    if letra is not None:
+        return letra * n
+    por_qubit = base.upper()
+    if len(por_qubit) != n or any(c not in _NOMBRES for c in por_qubit):
+        raise ValueError(f"Base desconocida '{base}' para un estado de {n} qubits")
+    return por_qubit
+
+def nombre_base(por_qubit: str) -> str:
+    """
+    Nombre canónico de una base: el nombre común si todos los qubits comparten base
+    ("computacional", "hadamard", "circular") o la cadena por qubit (ej. "ZXY").
+    """
+    if len(set(por_qubit)) == 1:
+        return _NOMBRES[por_qubit[0]]
+    return por_qubit
+
+def _mariposa(vector: List[complex], bit: int) -> None:
+    """Paso (a, b) -> (a + b, a - b) sobre los pares que difieren en `bit`, sin normalizar."""
+    paso = bit << 1
+    if bit < len(vector) // paso:
+        # Pocos desplazamientos dentro del bloque: recorrerlos con cortes con salto
+        for j in range(bit):
+            bajos = vector[j::paso]
+            altos = vector[j + bit::paso]
+            vector[j::paso] = [a + b for a, b in zip(bajos, altos)]
+            vector[j + bit::paso] = [a - b for a, b in zip(bajos, altos)]
+    else:
+        # Pocos bloques: recorrerlos con cortes contiguos
+        for inicio in range(0, len(vector), paso):
+            bajos = vector[inicio:inicio + bit]
+            altos = vector[inicio + bit:inicio + paso]
+            vector[inicio:inicio + bit] = [a + b for a, b in zip(bajos, altos)]
+            vector[inicio + bit:inicio + paso] = [a - b for a, b in zip(bajos, altos)]
+
+def _fase(vector: List[complex], bit: int, fase: complex) -> None:
+    """Multiplica por `fase` las amplitudes cuyo índice tiene `bit` a 1."""
+    paso = bit << 1
+    if bit < len(vector) // paso:
+        for j in range(bit, paso):
+            vector[j::paso] = [a * fase for a in vector[j::paso]]
+    else:
+        for inicio in range(bit, len(vector), paso):
+            vector[inicio:inicio + bit] = [a * fase for a in vector[inicio:inicio + bit]]
+
+def transformada_hadamard(vector: List[complex], qubits: Sequence[int]) -> None:
+    """
+    Aplica H a cada uno de los qubits indicados, en el sitio: O(k * 2^n).
+
+    La normalización 2^(-k/2) se aplica una sola vez al final.
+    """
+    n = numero_qubits(len(vector))
+    for q in qubits:
+        _mariposa(vector, 1 << (n - 1 - q))
+    if qubits:
+        escala = 2 ** (-len(qubits) / 2)
+        vector[:] = [a * escala for a in vector]
+
+def cambiar_base(vector: List[complex], origen: str, destino: str) -> str:
+    """
+    Reexpresa en el sitio las amplitudes de `vector` de la base `origen` a `destino`.
+
+    Por qubit, con V_Z = I, V_X = H y V_Y = S H (columnas = vectores de la base), las
+    amplitudes cambian como c' = V_destino^† V_origen c. Se descompone en: H sobre los
+    qubits que salen de X o Y, la fase S (salen de Y) y S^† (entran en Y), y H sobre
+    los qubits que entran en X o Y. Los qubits que no cambian de base no se tocan.
+
+    Args:
+        vector: Amplitudes en la base `origen` (se modifican)
+        origen: Base actual (ver el docstring del módulo)
+        destino: Base deseada
+
+    Returns:
+        Nombre canónico de la base destino (ver `nombre_base`)
+
+    Raises:
+        ValueError: Si alguna de las bases no es válida para el número de qubits
+    """
+    n = numero_qubits(len(vector))
+    de = bases_por_qubit(origen, n)
+    a = bases_por_qubit(destino, n)
+    cambian = [q for q in range(n) if de[q] != a[q]]
+
+    salida = [q for q in cambian if de[q] != "Z"]
+    entrada = [q for q in cambian if a[q] != "Z"]
+    for q in salida:
+        _mariposa(vector, 1 << (n - 1 - q))
+    for q in cambian:
+        fase = (1j if de[q] == "Y" else 1) * (-1j if a[q] == "Y" else 1)
+        if fase != 1:
+            _fase(vector, 1 << (n - 1 - q), fase)
+    for q in entrada:
+        _mariposa(vector, 1 << (n - 1 - q))
+
+    num_h = len(salida) + len(entrada)
+    if num_h:
+        escala = 2 ** (-num_h / 2)
+        vector[:] = [c * escala for c in vector]
+    return nombre_base(a)
+
+def matriz_cambio(origen: str, destino: str) -> List[List[complex]]:
+    """Matriz 2x2 V_destino^† V_origen que cambia un qubit de base (letras Z, X o Y)."""
+    v_origen, v_destino = _VECTORES[origen], _VECTORES[destino]
+    return [[sum(complex(v_destino[k][i]).conjugate() * v_origen[k][j] for k in range(2))
+             for j in range(2)] for i in range(2)]
+
+def misma_base(origen: str, destino: str, n: int) -> bool:
+    """Indica si dos nombres de base describen la misma base para n qubits."""
+    if origen == destino:
+        return True
+    return bases_por_qubit(origen, n) == bases_por_qubit(destino, n)
+
+def probabilidades_en_base(vector: Sequence[complex], origen: str, destino: str,
+                           backend: Optional[str] = None) -> List[float]:
+    """
+    Probabilidades de medir en la base `destino` un estado expresado en `origen`.
+
+    Sólo se usa un búfer de trabajo con las amplitudes transformadas (creado por el
+    backend); ni `vector` ni el estado al que pertenece se modifican.
+
+    Args:
+        vector: Amplitudes en la base `origen`
+        origen: Base actual
+        destino: Base de medición
+        backend: Backend de cálculo (si None, el global; ver `backends`)
+    """
+    n = numero_qubits(len(vector))
+    motor = obtener_backend(backend)
+    if misma_base(origen, destino, n):
+        return motor.probabilidades(vector)
+    trabajo = motor.copiar_vector(vector)
+    if isinstance(trabajo, list):
+        # Listas de Python: transformada rápida con cortes, más rápida que puerta a puerta
+        cambiar_base(trabajo, origen, destino)
+    else:
+        de = bases_por_qubit(origen, n)
+        a = bases_por_qubit(destino, n)
+        for q in range(n):
+            if de[q] != a[q]:
+                motor.aplicar_matriz_local_en_sitio(matriz_cambio(de[q], a[q]), trabajo, [q], n)
+    return motor.probabilidades(trabajo)
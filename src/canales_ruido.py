@@ -0,0 +1,200 @@
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import math
+import random
+from estado_cuantico import EstadoCuantico
+from matriz_densidad import MatrizDensidad
+from operador_cuantico import OperadorCuantico, aplicar_matriz_local, aplicar_kraus_local
+
+class CanalCuantico:
+    def __init__(self, nombre: str, kraus: List[OperadorCuantico]):
+        """
+        Inicializa un canal cuántico a partir de sus operadores de Kraus.
+
+        Args:
+            nombre: Nombre identificativo del canal (ej. "BitFlip(0.1)")
+            kraus: Operadores de Kraus K_k, que deben cumplir sum_k K_k† K_k = I
+        """
+        if not kraus:
+            raise ValueError("El canal necesita al menos un operador de Kraus")
+        dimension = len(kraus[0].matriz)
+        for k in kraus:
+            if len(k.matriz) != dimension:
+                raise ValueError("Todos los operadores de Kraus deben tener la misma dimensión")
+
+        # Verificar completitud: sum_k K_k† K_k = I
+        for i in range(dimension):
+            for j in range(dimension):
+                suma = sum(complex(k.matriz[f][i]).conjugate() * k.matriz[f][j]
+                           for k in kraus for f in range(dimension))
+                if abs(suma - (1 if i == j else 0)) > 1e-6:
+                    raise ValueError(f"Los operadores de Kraus del canal '{nombre}' no son completos")
+
+        self.nombre = nombre
+        self.kraus = kraus
+
+    def aplicar_densidad(self, rho: MatrizDensidad, qubits: Optional[Sequence[int]] = None,
+                         backend: Optional[str] = None) -> MatrizDensidad:
+        """
+        Aplica el canal de forma exacta: rho -> sum_k K_k rho K_k†.
+
+        Args:
+            rho: Matriz densidad a transformar
+            qubits: Qubits sobre los que actúa el canal (si None, sobre todo el sistema)
+            backend: Backend de cálculo (si None, el global; ver `backends`)
+
+        Returns:
+            Nueva matriz densidad resultante
+        """
+        nueva = aplicar_kraus_local([k.matriz for k in self.kraus], rho.matriz, qubits, backend)
+        return MatrizDensidad(f"{rho.id}_{self.nombre}", nueva, rho.base)
+
+    def muestrear(self, vector: List[complex], qubits: Sequence[int], generador: random.Random) -> List[complex]:
+        """
+        Aplica un operador de Kraus elegido al azar (un salto de trayectoria cuántica).
+
+        El operador K_k se elige con probabilidad ||K_k psi||^2 y el resultado se renormaliza.
+
+        Args:
+            vector: Amplitudes del estado puro
+            qubits: Qubits sobre los que actúa el canal
+            generador: Generador aleatorio de la trayectoria
+
+        Returns:
+            Nuevo vector de amplitudes normalizado
+        """
+        umbral = generador.random()
+        acumulada = 0.0
+        elegido, prob_elegido = None, 0.0
+        for k in self.kraus:
+            candidato = aplicar_matriz_local(k.matriz, vector, qubits)
+            prob = sum(abs(a) ** 2 for a in candidato)
+            if prob > 0:
+                # Si el redondeo deja umbral >= suma total, se queda el último posible
+                elegido, prob_elegido = candidato, prob
+            acumulada += prob
+            if umbral < acumulada and prob > 0:
+                break
+        norma = math.sqrt(prob_elegido)
+        return [a / norma for a in elegido]
+
+    def __str__(self) -> str:
+        return f"Canal {self.nombre} ({len(self.kraus)} operadores de Kraus)"
+
+    def __repr__(self) -> str:
+        return f"CanalCuantico(nombre={self.nombre!r}, kraus={self.kraus!r})"
+
+# Canales predefinidos
+def _verificar_probabilidad(p: float) -> None:
+    if not 0 <= p <= 1:
+        raise ValueError(f"La probabilidad debe estar entre 0 y 1 (p = {p})")
+
+def crear_canal_bit_flip(p: float) -> CanalCuantico:
+    """Crea el canal bit-flip: aplica X con probabilidad p"""
+    _verificar_probabilidad(p)
+    return CanalCuantico(f"BitFlip({p})", [
+        OperadorCuantico("I", [[math.sqrt(1 - p), 0], [0, math.sqrt(1 - p)]]),
+        OperadorCuantico("X", [[0, math.sqrt(p)], [math.sqrt(p), 0]])
+    ])
+
+def crear_canal_phase_flip(p: float) -> CanalCuantico:
+    """Crea el canal phase-flip: aplica Z con probabilidad p"""
+    _verificar_probabilidad(p)
+    return CanalCuantico(f"PhaseFlip({p})", [
+        OperadorCuantico("I", [[math.sqrt(1 - p), 0], [0, math.sqrt(1 - p)]]),
+        OperadorCuantico("Z", [[math.sqrt(p), 0], [0, -math.sqrt(p)]])
+    ])
+
+def crear_canal_despolarizante(p: float) -> CanalCuantico:
+    """Crea el canal despolarizante: rho -> (1 - p) rho + p I/2"""
+    _verificar_probabilidad(p)
+    a = math.sqrt(1 - 3 * p / 4)
+    b = math.sqrt(p / 4)
+    return CanalCuantico(f"Despolarizante({p})", [
+        OperadorCuantico("I", [[a, 0], [0, a]]),
+        OperadorCuantico("X", [[0, b], [b, 0]]),
+        OperadorCuantico("Y", [[0, -1j * b], [1j * b, 0]]),
+        OperadorCuantico("Z", [[b, 0], [0, -b]])
+    ])
+
+def crear_canal_amortiguamiento(gamma: float) -> CanalCuantico:
+    """Crea el canal de amortiguamiento de amplitud: |1> decae a |0> con probabilidad gamma"""
+    _verificar_probabilidad(gamma)
+    return CanalCuantico(f"Amortiguamiento({gamma})", [
+        OperadorCuantico("K0", [[1, 0], [0, math.sqrt(1 - gamma)]]),
+        OperadorCuantico("K1", [[0, math.sqrt(gamma)], [0, 0]])
+    ])
+
+# Simulación por trayectorias cuánticas
+Paso = Tuple[Union[OperadorCuantico, CanalCuantico], Optional[Sequence[int]]]
+
+def _ejecutar_trayectorias(vector: List[complex], pasos: Sequence[Paso], semilla: int,
+                           inicio: int, fin: int) -> Tuple[List[float], List[float]]:
+    """
+    Ejecuta las trayectorias [inicio, fin) y devuelve la suma y la suma de cuadrados
+    de las probabilidades de cada resultado.
+
+    Cada trayectoria usa su propio generador derivado de (semilla, índice), de modo
+    que el resultado no depende de cómo se repartan entre procesos.
+    """
+    dimension = len(vector)
+    todos = list(range(dimension.bit_length() - 1))
+    suma = [0.0] * dimension
+    suma_cuadrados = [0.0] * dimension
+    for t in range(inicio, fin):
+        generador = random.Random(f"{semilla}:{t}")
+        actual = vector
+        for elemento, qubits in pasos:
+            qubits = todos if qubits is None else qubits
+            if isinstance(elemento, CanalCuantico):
+                actual = elemento.muestrear(actual, qubits, generador)
+            else:
+                actual = aplicar_matriz_local(elemento.matriz, actual, qubits)
+        for i, amplitud in enumerate(actual):
+            prob = abs(amplitud) ** 2
+            suma[i] += prob
+            suma_cuadrados[i] += prob * prob
+    return suma, suma_cuadrados
+
+def simular_trayectorias(estado: EstadoCuantico, pasos: Sequence[Paso], num_trayectorias: int,
+                         semilla: int = 0, procesos: int = 1) -> Dict[str, Dict[str, float]]:
+    """
+    Simula un circuito ruidoso promediando trayectorias cuánticas estocásticas de estados puros.
+
+    Args:
+        estado: Estado inicial
+        pasos: Secuencia de (OperadorCuantico o CanalCuantico, qubits); qubits None = todo el sistema
+        num_trayectorias: Número de trayectorias a promediar
+        semilla: Semilla para reproducir los resultados
+        procesos: Número de procesos trabajadores (1 = en el proceso actual)
+
+    Returns:
+        Diccionario con las claves:
+            "probabilidades": media de las probabilidades de cada estado base
+            "error_estandar": error estándar de cada media (para juzgar la convergencia)
+    """
+    if num_trayectorias < 1:
+        raise ValueError("Se necesita al menos una trayectoria")
+    vector = list(estado.vector)
+    procesos = max(1, min(procesos, num_trayectorias))
+
+    if procesos == 1:
+        parciales = [_ejecutar_trayectorias(vector, pasos, semilla, 0, num_trayectorias)]
+    else:
+        cortes = [num_trayectorias * i // procesos for i in range(procesos + 1)]
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            futuros = [ejecutor.submit(_ejecutar_trayectorias, vector, pasos, semilla, inicio, fin)
+                       for inicio, fin in zip(cortes, cortes[1:])]
+            parciales = [f.result() for f in futuros]
+
+    probabilidades = {}
+    error_estandar = {}
+    for i in range(len(vector)):
+        suma = math.fsum(p[0][i] for p in parciales)
+        suma_cuadrados = math.fsum(p[1][i] for p in parciales)
+        media = suma / num_trayectorias
+        varianza = max(suma_cuadrados / num_trayectorias - media * media, 0.0)
+        probabilidades[str(i)] = media
+        error_estandar[str(i)] = math.sqrt(varianza / num_trayectorias)
+    return {"probabilidades": probabilidades, "error_estandar": error_estandar}
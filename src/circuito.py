@@ -0,0 +1,97 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+import random
+from estado_cuantico import EstadoCuantico
+from operador_cuantico import OperadorCuantico
+
+class Circuito:
+    def __init__(self, nombre: str = "circuito"):
+        """
+        Inicializa un circuito vacío con medición a mitad de circuito y puertas condicionadas.
+
+        Args:
+            nombre: Nombre identificativo del circuito
+        """
+        self.nombre = nombre
+        # Instrucciones: ("puerta", operador, qubits, condicion) o ("medir", qubits, clave)
+        self.instrucciones: List[Tuple] = []
+
+    def puerta(self, operador: OperadorCuantico, qubits: Optional[Sequence[int]] = None,
+               condicion: Optional[Tuple[str, str]] = None) -> "Circuito":
+        """
+        Añade la aplicación de un operador.
+
+        Args:
+            operador: Operador a aplicar
+            qubits: Qubits sobre los que actúa (si None, sobre todo el estado)
+            condicion: Par (clave, resultado): sólo se aplica si la medición guardada en
+                `clave` dio `resultado` (ej. ("m0", "1"))
+
+        Returns:
+            El propio circuito, para encadenar llamadas
+        """
+        self.instrucciones.append(("puerta", operador, None if qubits is None else list(qubits), condicion))
+        return self
+
+    def medir(self, qubits: Sequence[int], clave: str) -> "Circuito":
+        """
+        Añade una medición proyectiva que colapsa el estado y guarda el resultado.
+
+        Args:
+            qubits: Qubits a medir
+            clave: Nombre del registro clásico donde se guarda el resultado
+
+        Returns:
+            El propio circuito, para encadenar llamadas
+        """
+        self.instrucciones.append(("medir", list(qubits), clave))
+        return self
+
+    def ejecutar_disparo(self, estado: EstadoCuantico, generador: Optional[random.Random] = None) -> Dict[str, str]:
+        """
+        Ejecuta el circuito una vez sobre `estado`, modificándolo en el sitio.
+
+        Args:
+            estado: Estado sobre el que se ejecuta (se modifica)
+            generador: Generador aleatorio para las mediciones
+
+        Returns:
+            Registro clásico {clave: resultado} con las mediciones realizadas
+        """
+        registro: Dict[str, str] = {}
+        for instruccion in self.instrucciones:
+            if instruccion[0] == "medir":
+                _, qubits, clave = instruccion
+                registro[clave] = estado.colapsar(qubits, generador)
+            else:
+                _, operador, qubits, condicion = instruccion
+                if condicion is not None and registro.get(condicion[0]) != condicion[1]:
+                    continue
+                operador.aplicar(estado, qubits, en_sitio=True)
+        return registro
+
+    def ejecutar(self, estado: EstadoCuantico, disparos: int = 1, semilla: Optional[int] = None) -> Dict[str, int]:
+        """
+        Ejecuta el circuito muchas veces y cuenta los resultados de las mediciones.
+
+        El estado original no se modifica: cada disparo parte de una copia de su vector.
+
+        Args:
+            estado: Estado inicial
+            disparos: Número de ejecuciones
+            semilla: Semilla para reproducir los resultados
+
+        Returns:
+            Diccionario {resultados: cuentas}, donde "resultados" concatena los valores del
+            registro clásico en orden de clave separados por espacios (ej. "0 1")
+        """
+        generador = random.Random(semilla)
+        cuentas: Dict[str, int] = {}
+        for _ in range(disparos):
+            copia = EstadoCuantico._sin_validar(estado.id, list(estado.vector), estado.base)
+            registro = self.ejecutar_disparo(copia, generador)
+            resultado = " ".join(registro[clave] for clave in sorted(registro))
+            cuentas[resultado] = cuentas.get(resultado, 0) + 1
+        return cuentas
+
+    def __str__(self) -> str:
+        return f"Circuito {self.nombre} ({len(self.instrucciones)} instrucciones)"
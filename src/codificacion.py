@@ -0,0 +1,194 @@
+"""
+Codificación compacta de vectores de amplitudes para `RepositorioDeEstados.guardar`.
+
+Un vector codificado es un diccionario JSON con la clave "__vector__":
+
+    {"__vector__": True, "formato": "denso" | "disperso", "precision": "complex128" | "complex64",
+     "compresion": None | "zlib" | "lzma", "dimension": N, "no_nulos": k, "datos": "<base64>"}
+
+En formato disperso, "datos" contiene primero los k índices (int64) y después las k
+amplitudes; en formato denso, las N amplitudes. Los números se guardan en little-endian.
+"""
+
+from array import array
+from typing import Dict, List, Optional, Sequence
+import base64
+import sys
+import time
+
+_TIPOS = {"complex128": "d", "complex64": "f"}
+_BYTES_AMPLITUD = {"complex128": 16, "complex64": 8}
+_BYTES_INDICE = 8
+
+# Por debajo de este número de amplitudes se guarda la lista JSON tal cual (legible)
+DIMENSION_MINIMA = 16
+# Por encima de este tamaño en bytes se comprime con zlib en el modo "auto"
+UMBRAL_COMPRESION = 1024
+
+def _a_bytes(datos: array) -> bytes:
+    if sys.byteorder == "big":
+        datos = array(datos.typecode, datos)
+        datos.byteswap()
+    return datos.tobytes()
+
+def _desde_bytes(tipo: str, crudo: bytes) -> array:
+    datos = array(tipo)
+    datos.frombytes(crudo)
+    if sys.byteorder == "big":
+        datos.byteswap()
+    return datos
+
+def _comprimir(crudo: bytes, compresion: Optional[str]) -> bytes:
+    if compresion is None:
+        return crudo
+    if compresion == "zlib":
+        import zlib
+        return zlib.compress(crudo)
+    if compresion == "lzma":
+        import lzma
+        return lzma.compress(crudo)
+    raise ValueError(f"Compresión desconocida: '{compresion}'")
+
+def _descomprimir(crudo: bytes, compresion: Optional[str]) -> bytes:
+    if compresion is None:
+        return crudo
+    if compresion == "zlib":
+        import zlib
+        return zlib.decompress(crudo)
+    if compresion == "lzma":
+        import lzma
+        return lzma.decompress(crudo)
+    raise ValueError(f"Compresión desconocida: '{compresion}'")
+
+def _amplitudes_a_array(amplitudes: Sequence[complex], precision: str) -> array:
+    datos = array(_TIPOS[precision])
+    for a in amplitudes:
+        a = complex(a)
+        datos.append(a.real)
+        datos.append(a.imag)
+    return datos
+
+def codificar_vector(vector: Sequence[complex], formato: str = "denso", precision: str = "complex128",
+                     compresion: Optional[str] = None) -> Dict:
+    """
+    Codifica un vector de amplitudes en un diccionario serializable a JSON.
+
+    Args:
+        vector: Amplitudes a codificar
+        formato: "denso" (todas las amplitudes) o "disperso" (pares índice/valor no nulos)
+        precision: "complex128" (sin pérdida) o "complex64" (mitad de tamaño, ~7 cifras)
+        compresion: None, "zlib" o "lzma"
+    """
+    if precision not in _TIPOS:
+        raise ValueError(f"Precisión desconocida: '{precision}'")
+    if formato == "denso":
+        no_nulos = len(vector)
+        crudo = _a_bytes(_amplitudes_a_array(vector, precision))
+    elif formato == "disperso":
+        indices = array('q', (i for i, a in enumerate(vector) if a))
+        no_nulos = len(indices)
+        crudo = _a_bytes(indices) + _a_bytes(_amplitudes_a_array([vector[i] for i in indices], precision))
+    else:
+        raise ValueError(f"Formato desconocido: '{formato}'")
+
+    return {
+        "__vector__": True,
+        "formato": formato,
+        "precision": precision,
+        "compresion": compresion,
+        "dimension": len(vector),
+        "no_nulos": no_nulos,
+        "datos": base64.b64encode(_comprimir(crudo, compresion)).decode("ascii")
+    }
+
+def decodificar_vector(codificado: Dict) -> List[complex]:
+    """
+    Reconstruye la lista de amplitudes a partir de un diccionario de `codificar_vector`.
+    """
+    crudo = _descomprimir(base64.b64decode(codificado["datos"]), codificado["compresion"])
+    tipo = _TIPOS[codificado["precision"]]
+    if codificado["formato"] == "denso":
+        datos = _desde_bytes(tipo, crudo)
+        return [complex(re, im) for re, im in zip(datos[0::2], datos[1::2])]
+
+    no_nulos = codificado["no_nulos"]
+    indices = _desde_bytes('q', crudo[:no_nulos * _BYTES_INDICE])
+    datos = _desde_bytes(tipo, crudo[no_nulos * _BYTES_INDICE:])
+    vector = [0j] * codificado["dimension"]
+    for i, re, im in zip(indices, datos[0::2], datos[1::2]):
+        vector[i] = complex(re, im)
+    return vector
+
+def elegir_codificacion(vector: Sequence[complex], precision: str = "complex128",
+                        compresion: Optional[str] = "auto") -> Optional[Dict[str, Optional[str]]]:
+    """
+    Elige automáticamente cómo guardar un vector según su tamaño y su dispersión.
+
+    Args:
+        vector: Amplitudes a guardar
+        precision: Precisión con la que se permite guardar ("complex128" o "complex64")
+        compresion: "auto" (zlib si el resultado supera UMBRAL_COMPRESION bytes),
+            None, "zlib" o "lzma"
+
+    Returns:
+        Parámetros para `codificar_vector` (formato, precision, compresion), o None si
+        conviene guardar la lista JSON tal cual (vectores pequeños en complex128)
+    """
+    if len(vector) < DIMENSION_MINIMA and precision == "complex128" and compresion in (None, "auto"):
+        return None
+    bytes_amplitud = _BYTES_AMPLITUD[precision]
+    no_nulos = sum(1 for a in vector if a)
+    tamano_disperso = no_nulos * (_BYTES_INDICE + bytes_amplitud)
+    tamano_denso = len(vector) * bytes_amplitud
+    formato = "disperso" if tamano_disperso < tamano_denso else "denso"
+    if compresion == "auto":
+        compresion = "zlib" if min(tamano_disperso, tamano_denso) > UMBRAL_COMPRESION else None
+    return {"formato": formato, "precision": precision, "compresion": compresion}
+
+def comparar_codificaciones(vector: Sequence[complex], repeticiones: int = 3) -> List[Dict]:
+    """
+    Mide tamaño, velocidad y error de cada combinación de formato, precisión y compresión.
+
+    Args:
+        vector: Amplitudes de prueba
+        repeticiones: Veces que se repite cada medición (se toma el mejor tiempo)
+
+    Returns:
+        Lista de diccionarios con "formato", "precision", "compresion", "bytes",
+        "segundos_codificar", "segundos_decodificar" y "error_maximo", empezando por
+        la lista JSON sin codificar como referencia
+    """
+    import json
+
+    def mejor_tiempo(funcion):
+        mejor = float("inf")
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            resultado = funcion()
+            mejor = min(mejor, time.perf_counter() - inicio)
+        return resultado, mejor
+
+    def complejo_a_json(obj):
+        return {"__complex__": True, "real": obj.real, "imag": obj.imag}
+
+    texto, t_codificar = mejor_tiempo(lambda: json.dumps([complex(a) for a in vector], default=complejo_a_json))
+    _, t_decodificar = mejor_tiempo(lambda: json.loads(texto))
+    informe = [{"formato": "json", "precision": "complex128", "compresion": None, "bytes": len(texto),
+                "segundos_codificar": t_codificar, "segundos_decodificar": t_decodificar, "error_maximo": 0.0}]
+
+    for formato in ("denso", "disperso"):
+        for precision in _TIPOS:
+            for compresion in (None, "zlib", "lzma"):
+                codificado, t_codificar = mejor_tiempo(
+                    lambda: codificar_vector(vector, formato, precision, compresion))
+                decodificado, t_decodificar = mejor_tiempo(lambda: decodificar_vector(codificado))
+                informe.append({
+                    "formato": formato,
+                    "precision": precision,
+                    "compresion": compresion,
+                    "bytes": len(json.dumps(codificado)),
+                    "segundos_codificar": t_codificar,
+                    "segundos_decodificar": t_decodificar,
+                    "error_maximo": max((abs(a - b) for a, b in zip(vector, decodificado)), default=0.0)
+                })
+    return informe
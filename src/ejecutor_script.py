@@ -0,0 +1,168 @@
+"""
+Ejecución no interactiva de un archivo de operaciones en formato JSON Lines.
+
+Cada línea es un objeto con una clave "op" y sus parámetros:
+
+    {"op": "agregar", "id": "q0", "vector": [1, 0], "base": "computacional"}
+    {"op": "aplicar", "id": "q0", "operador": "H", "nuevo_id": "q0h", "qubits": [0]}
+    {"op": "medir", "id": "q0h", "base": "hadamard"}
+    {"op": "cambiar_base", "id": "q0h", "base": "ZX"}
+    {"op": "guardar", "archivo": "estados.json"}
+    {"op": "cargar", "archivo": "estados.json"}
+
+Las amplitudes pueden ser números, cadenas ("0.6+0.8j") o pares [real, imag].
+Por cada operación se emite una línea JSON con el resultado.
+"""
+
+import json
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Union
+from repositorio import RepositorioDeEstados
+from operador_cuantico import OperadorCuantico, operadores_predefinidos
+
+def _a_complejo(valor: Union[int, float, str, List[float]]) -> complex:
+    """Convierte una amplitud del script a número complejo."""
+    if isinstance(valor, list):
+        if len(valor) != 2:
+            raise ValueError(f"Amplitud no válida: {valor!r}")
+        return complex(valor[0], valor[1])
+    return complex(valor)
+
+def _a_json(valor):
+    """Convierte números complejos a pares [real, imag] para la salida."""
+    if isinstance(valor, complex):
+        return [valor.real, valor.imag]
+    raise TypeError(f"Object of type {valor.__class__.__name__} is not JSON serializable")
+
+class EjecutorScript:
+    def __init__(self, repo: Optional[RepositorioDeEstados] = None,
+                 operadores: Optional[Dict[str, OperadorCuantico]] = None):
+        """
+        Inicializa el ejecutor sobre un repositorio.
+
+        Args:
+            repo: Repositorio sobre el que se ejecutan las operaciones (uno nuevo si None)
+            operadores: Operadores disponibles por nombre (los predefinidos si None)
+        """
+        self.repo = repo if repo is not None else RepositorioDeEstados()
+        self.operadores = operadores if operadores is not None else operadores_predefinidos()
+        self.errores = 0
+
+    def ejecutar(self, lineas: Iterable[str]) -> Iterator[Dict]:
+        """
+        Ejecuta las operaciones y genera un resultado por cada una.
+
+        Las operaciones "agregar" consecutivas con la misma base se agrupan y se
+        insertan en lote con `agregar_estados`; si el lote falla, se reintentan una
+        a una para informar del error en la línea correspondiente.
+
+        Args:
+            lineas: Líneas del script (las vacías y las que empiezan por "#" se ignoran)
+
+        Returns:
+            Iterador de diccionarios con "linea", "op", "ok" y los datos del resultado
+        """
+        lote: List = []
+        for numero, linea in enumerate(lineas, start=1):
+            linea = linea.strip()
+            if not linea or linea.startswith("#"):
+                continue
+            orden = None
+            try:
+                orden = json.loads(linea)
+                if not isinstance(orden, dict):
+                    raise ValueError("Cada línea debe ser un objeto JSON")
+                # Los IDs se guardan siempre como cadenas, sea cual sea su tipo en el JSON
+                for clave in ("id", "nuevo_id"):
+                    if orden.get(clave) is not None:
+                        orden[clave] = str(orden[clave])
+                if orden.get("op") == "agregar":
+                    vector = [_a_complejo(a) for a in orden["vector"]]
+                    base = orden.get("base", "computacional")
+                    if lote and lote[0][2] != base:
+                        yield from self._vaciar_lote(lote)
+                    lote.append((numero, orden["id"], base, vector))
+                    continue
+            except (ValueError, KeyError, TypeError) as e:
+                yield from self._vaciar_lote(lote)
+                yield self._error(numero, orden.get("op") if isinstance(orden, dict) else None, e)
+                continue
+
+            yield from self._vaciar_lote(lote)
+            yield self._ejecutar_orden(numero, orden)
+        yield from self._vaciar_lote(lote)
+
+    def _vaciar_lote(self, lote: List) -> Iterator[Dict]:
+        """Inserta las operaciones "agregar" pendientes y vacía el lote."""
+        if not lote:
+            return
+        pendientes = list(lote)
+        lote.clear()
+        try:
+            self.repo.agregar_estados([id for _, id, _, _ in pendientes],
+                                      [v for _, _, _, v in pendientes], pendientes[0][2])
+        except ValueError:
+            for numero, id, base, vector in pendientes:
+                try:
+                    self.repo.agregar_estado(id, vector, base)
+                    yield {"linea": numero, "op": "agregar", "ok": True, "id": id}
+                except ValueError as e:
+                    yield self._error(numero, "agregar", e)
+            return
+        for numero, id, _, _ in pendientes:
+            yield {"linea": numero, "op": "agregar", "ok": True, "id": id}
+
+    def _ejecutar_orden(self, numero: int, orden: Dict) -> Dict:
+        """Ejecuta una operación distinta de "agregar"."""
+        op = orden.get("op")
+        try:
+            if op == "aplicar":
+                nombre = str(orden["operador"]).upper()
+                if nombre not in self.operadores:
+                    raise ValueError(f"Operador '{nombre}' no disponible")
+                nuevo = self.repo.aplicar_operador(orden["id"], self.operadores[nombre],
+                                                   orden.get("nuevo_id"), orden.get("qubits"))
+                return {"linea": numero, "op": op, "ok": True, "id": nuevo.id}
+            elif op == "medir":
+                probs = self.repo.medir_estado(orden["id"], orden.get("base"))
+                return {"linea": numero, "op": op, "ok": True, "id": orden["id"], "probabilidades": probs}
+            elif op == "cambiar_base":
+                estado = self.repo.cambiar_base(orden["id"], orden["base"])
+                return {"linea": numero, "op": op, "ok": True, "id": estado.id, "base": estado.base}
+            elif op == "guardar":
+                self.repo.guardar(orden["archivo"])
+                return {"linea": numero, "op": op, "ok": True, "archivo": orden["archivo"]}
+            elif op == "cargar":
+                errores = self.repo.cargar(orden["archivo"])
+                if errores:
+                    self.errores += 1
+                    return {"linea": numero, "op": op, "ok": False, "archivo": orden["archivo"],
+                            "estados": len(self.repo.estados), "error": "; ".join(errores),
+                            "errores": errores}
+                return {"linea": numero, "op": op, "ok": True, "archivo": orden["archivo"],
+                        "estados": len(self.repo.estados)}
+            else:
+                raise ValueError(f"Operación desconocida: {op!r}")
+        except Exception as e:
+            return self._error(numero, op, e)
+
+    def _error(self, numero: int, op: Optional[str], error: Exception) -> Dict:
+        self.errores += 1
+        mensaje = f"Falta el parámetro {error}" if isinstance(error, KeyError) else str(error)
+        return {"linea": numero, "op": op, "ok": False, "error": mensaje}
+
+def ejecutar_script(entrada: TextIO, salida: TextIO, repo: Optional[RepositorioDeEstados] = None) -> int:
+    """
+    Ejecuta un script JSON Lines y escribe los resultados como JSON Lines.
+
+    Args:
+        entrada: Archivo de operaciones
+        salida: Archivo donde escribir un resultado JSON por línea
+        repo: Repositorio sobre el que se ejecuta (uno nuevo si None)
+
+    Returns:
+        Número de operaciones que fallaron
+    """
+    ejecutor = EjecutorScript(repo)
+    for resultado in ejecutor.ejecutar(entrada):
+        salida.write(json.dumps(resultado, default=_a_json, ensure_ascii=False) + "\n")
+    return ejecutor.errores
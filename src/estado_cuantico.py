@@ -1,6 +1,9 @@
-import json
-from typing import List, Dict, Union
+from typing import List, Dict, Optional, Sequence, Union
 import math
+import random
+import bases
+import observables
+from backends import obtener_backend
 
 class EstadoCuantico:
     def __init__(self, id: str, vector: List[complex], base: str = "computacional"):
@@ -24,22 +27,112 @@ class EstadoCuantico:
         if not math.isclose(suma_cuadrados, 1.0, rel_tol=1e-5):
             raise ValueError(f"El vector no está normalizado (suma de cuadrados = {suma_cuadrados})")
 
-    def medir(self) -> Dict[str, float]:
+    def medir(self, backend: Optional[str] = None, base: Optional[str] = None) -> Dict[str, float]:
         """
         Calcula las probabilidades de medición para cada estado base.
         
+        Args:
+            backend: Backend de cálculo para esta llamada (si None, el global; ver `backends`)
+            base: Base en la que se mide (si None, la del estado; ver `bases`). El
+                estado no se modifica ni se crean estados intermedios.
+        
         Returns:
             Diccionario con las probabilidades de cada resultado de medición.
             Las claves son strings representando los estados base (ej. "0", "1", etc.)
         """
+        if base is not None and base != self.base:
+            lista = bases.probabilidades_en_base(self.vector, self.base, base, backend)
+        else:
+            lista = obtener_backend(backend).probabilidades(self.vector)
         probabilidades = {}
-        for i, amplitud in enumerate(self.vector):
-            prob = abs(amplitud)**2
+        for i, prob in enumerate(lista):
             estado_base = str(i)  # "0", "1", etc.
             probabilidades[estado_base] = prob
             
         return probabilidades
     
+    def cambiar_base(self, base: str) -> None:
+        """
+        Reexpresa el estado en otra base, actualizando el vector en el sitio y `self.base`.
+        
+        Args:
+            base: Base destino: "computacional", "hadamard", "circular" o una letra
+                Z/X/Y por qubit (ej. "ZX"); ver `bases`
+            
+        Raises:
+            ValueError: Si la base destino o la actual no son bases reconocidas
+        """
+        self.base = bases.cambiar_base(self.vector, self.base, base)
+    
+    def colapsar(self, qubits: Optional[Sequence[int]] = None, generador: Optional[random.Random] = None) -> str:
+        """
+        Realiza una medición proyectiva que colapsa el estado.
+        
+        El vector se actualiza en el sitio (sin copiar las 2^n amplitudes): las
+        amplitudes incompatibles con el resultado se anulan y el resto se renormaliza.
+        
+        Args:
+            qubits: Qubits a medir (si None, todos). El qubit 0 es el más significativo.
+            generador: Generador aleatorio (si None, el del módulo `random`)
+            
+        Returns:
+            Resultado como cadena de bits, un carácter por qubit medido en el orden dado (ej. "01")
+        """
+        n = observables.numero_qubits(len(self.vector))
+        if qubits is None:
+            qubits = range(n)
+        if len(set(qubits)) != len(qubits) or any(not 0 <= q < n for q in qubits):
+            raise ValueError(f"Qubits no válidos {list(qubits)} para un estado de {n} qubits")
+        posiciones = [n - 1 - q for q in qubits]
+        mascara = sum(1 << pos for pos in posiciones)
+        
+        # Probabilidad de cada resultado, identificado por los bits medidos del índice
+        probabilidades: Dict[int, float] = {}
+        for i, amplitud in enumerate(self.vector):
+            if amplitud:
+                clave = i & mascara
+                probabilidades[clave] = probabilidades.get(clave, 0.0) + abs(amplitud)**2
+        
+        umbral = (generador or random).random() * sum(probabilidades.values())
+        acumulada = 0.0
+        for resultado, prob in probabilidades.items():
+            acumulada += prob
+            if umbral < acumulada:
+                break
+        
+        escala = 1 / math.sqrt(prob)
+        vector = self.vector
+        for i in range(len(vector)):
+            if i & mascara == resultado:
+                vector[i] *= escala
+            else:
+                vector[i] = 0
+        return "".join("1" if resultado >> pos & 1 else "0" for pos in posiciones)
+    
+    def valor_esperado(self, observable) -> complex:
+        """
+        Calcula <psi|O|psi> sin crear ni almacenar estados intermedios.
+        
+        Args:
+            observable: Cadena de Pauli (ej. "ZI", "XY") u OperadorCuantico
+            
+        Returns:
+            float para cadenas de Pauli, complex para operadores arbitrarios
+        """
+        return observables.valor_esperado(self.vector, observable)
+    
+    def producto_interno(self, otro: "EstadoCuantico") -> complex:
+        """
+        Calcula el producto interno <self|otro>.
+        """
+        return observables.producto_interno(self.vector, otro.vector)
+    
+    def fidelidad(self, otro: "EstadoCuantico") -> float:
+        """
+        Calcula la fidelidad |<self|otro>|^2 entre dos estados puros.
+        """
+        return observables.fidelidad(self.vector, otro.vector)
+    
     def __str__(self) -> str:
         """
         Representación legible del estado cuántico.
@@ -47,6 +140,26 @@ class EstadoCuantico:
         vector_str = "[" + ", ".join(f"{a.real:.3f}{a.imag:+.3f}j" for a in self.vector) + "]"
         return f"{self.id}: vector={vector_str} en base {self.base}"
     
+    def resumen(self, k: int = 3) -> str:
+        """
+        Representación truncada del estado, para listados de vectores grandes.
+        
+        Sólo se formatean las primeras y últimas `k` amplitudes; se incluyen además
+        la dimensión y la norma del vector.
+        
+        Args:
+            k: Número de amplitudes a mostrar en cada extremo
+        """
+        formato = lambda a: f"{a.real:.3f}{a.imag:+.3f}j"
+        n = len(self.vector)
+        if n <= 2 * k:
+            partes = [formato(complex(a)) for a in self.vector]
+        else:
+            partes = ([formato(complex(a)) for a in self.vector[:k]] + ["..."] +
+                      [formato(complex(a)) for a in self.vector[n - k:]])
+        norma = math.sqrt(sum(abs(a)**2 for a in self.vector))
+        return f"{self.id}: dim={n}, norma={norma:.6f}, vector=[{', '.join(partes)}] en base {self.base}"
+    
     def __repr__(self) -> str:
         return f"EstadoCuantico(id={self.id!r}, vector={self.vector!r}, base={self.base!r})"
     
@@ -66,3 +179,16 @@ class EstadoCuantico:
         Crea un EstadoCuantico a partir de un diccionario.
         """
         return cls(data["id"], data["vector"], data["base"])
+
+    @classmethod
+    def _sin_validar(cls, id: str, vector: List[complex], base: str = "computacional") -> "EstadoCuantico":
+        """
+        Crea un estado sin repetir la verificación de normalización.
+
+        Uso interno para rutas que ya validaron el vector (p. ej. la carga masiva).
+        """
+        estado = cls.__new__(cls)
+        estado.id = id
+        estado.vector = vector
+        estado.base = base
+        return estado
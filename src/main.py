@@ -1,6 +1,6 @@
 import sys
 from repositorio import RepositorioDeEstados
-from operador_cuantico import crear_operador_x, crear_operador_h, crear_operador_z
+from operador_cuantico import operadores_predefinidos
 
 def mostrar_menu():
     print("\n--- Simulador Cuántico ---")
@@ -12,15 +12,39 @@ def mostrar_menu():
     print("6. Cargar estados desde archivo")
     print("0. Salir")
 
+def ejecutar_modo_script(ruta: str) -> int:
+    """
+    Ejecuta un archivo de operaciones JSON Lines ("-" para la entrada estándar)
+    y escribe los resultados en la salida estándar, también como JSON Lines.
+    """
+    from ejecutor_script import ejecutar_script
+    
+    if ruta == "-":
+        errores = ejecutar_script(sys.stdin, sys.stdout)
+    else:
+        with open(ruta, 'r') as entrada:
+            errores = ejecutar_script(entrada, sys.stdout)
+    return 1 if errores else 0
+
+def parsear_argumentos(argv):
+    # argparse sólo se importa si hay argumentos: el menú interactivo arranca sin él
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Simulador Cuántico")
+    parser.add_argument("--script", metavar="ARCHIVO",
+                        help="Ejecuta un archivo de operaciones JSON Lines sin menú interactivo ('-' para stdin)")
+    return parser.parse_args(argv)
+
 def main():
+    if len(sys.argv) > 1:
+        args = parsear_argumentos(sys.argv[1:])
+        if args.script is not None:
+            sys.exit(ejecutar_modo_script(args.script))
+    
     repo = RepositorioDeEstados()
     
     # Operadores predefinidos
-    operadores = {
-        "X": crear_operador_x(),
-        "H": crear_operador_h(),
-        "Z": crear_operador_z()
-    }
+    operadores = operadores_predefinidos()
     
     while True:
         mostrar_menu()
@@ -29,12 +53,15 @@ def main():
         try:
             if opcion == "1":
                 print("\nEstados cuánticos registrados:")
-                estados = repo.listar_estados()
-                if not estados:
+                pagina, cursor = repo.listar_pagina()
+                if not pagina:
                     print("No hay estados registrados")
-                else:
-                    for estado in estados:
+                while pagina:
+                    for estado in pagina:
                         print(estado)
+                    if cursor is None or input("Enter para ver más, 'q' para volver: ").lower() == "q":
+                        break
+                    pagina, cursor = repo.listar_pagina(cursor)
                         
             elif opcion == "2":
                 print("\nAgregar nuevo estado cuántico")
@@ -77,8 +104,9 @@ def main():
             elif opcion == "4":
                 print("\nMedir estado cuántico")
                 id_estado = input("ID del estado a medir: ")
+                base = input("Base de medición (deje vacío para la del estado): ") or None
                 
-                probs = repo.medir_estado(id_estado)
+                probs = repo.medir_estado(id_estado, base)
                 print(f"\nProbabilidades de medición para {id_estado}:")
                 for estado_base, prob in probs.items():
                     print(f"- Estado base {estado_base}: {prob*100:.2f}%")
@@ -90,7 +118,8 @@ def main():
                 
             elif opcion == "6":
                 archivo = input("Nombre del archivo para cargar (ej. estados.json): ")
-                repo.cargar(archivo)
+                for error in repo.cargar(archivo):
+                    print(error)
                 print(f"Estados cargados desde {archivo}")
                 
             elif opcion == "0":
@@ -0,0 +1,138 @@
+from typing import Dict, List, Sequence, Union
+import math
+from observables import numero_qubits
+from backends import desplazamientos_qubits
+
+class MatrizDensidad:
+    def __init__(self, id: str, matriz: List[List[complex]], base: str = "computacional"):
+        """
+        Inicializa un estado mixto representado por su matriz densidad.
+
+        Args:
+            id: Identificador único del estado
+            matriz: Matriz densidad 2^n x 2^n (lista de listas de números complejos)
+            base: Base en la que está expresado el estado (por defecto "computacional")
+        """
+        if not matriz:
+            raise ValueError("La matriz densidad no puede estar vacía")
+        for fila in matriz:
+            if len(fila) != len(matriz):
+                raise ValueError("La matriz densidad debe ser cuadrada")
+        numero_qubits(len(matriz))
+
+        self.id = id
+        self.matriz = matriz
+        self.base = base
+
+        # Verificar traza unidad (con cierta tolerancia)
+        traza = sum(matriz[i][i] for i in range(len(matriz)))
+        if not math.isclose(complex(traza).real, 1.0, rel_tol=1e-5):
+            raise ValueError(f"La matriz densidad no tiene traza 1 (traza = {traza})")
+
+    @classmethod
+    def desde_estado(cls, estado) -> "MatrizDensidad":
+        """
+        Crea la matriz densidad |psi><psi| de un estado puro.
+
+        Args:
+            estado: EstadoCuantico de origen
+        """
+        conjugado = [complex(a).conjugate() for a in estado.vector]
+        matriz = [[a * c for c in conjugado] for a in estado.vector]
+        return cls(estado.id, matriz, estado.base)
+
+    @classmethod
+    def mezcla(cls, id: str, estados: Sequence, pesos: Sequence[float]) -> "MatrizDensidad":
+        """
+        Crea la mezcla estadística sum_k p_k |psi_k><psi_k|.
+
+        Sustituye a simular cada estado del conjunto por separado.
+
+        Args:
+            id: Identificador de la mezcla
+            estados: Estados puros (EstadoCuantico) de la misma dimensión
+            pesos: Probabilidades de cada estado (deben sumar 1)
+        """
+        if len(estados) != len(pesos) or not estados:
+            raise ValueError("Se necesita el mismo número (no nulo) de estados y pesos")
+        dimension = len(estados[0].vector)
+        matriz = [[0j] * dimension for _ in range(dimension)]
+        for estado, peso in zip(estados, pesos):
+            if len(estado.vector) != dimension:
+                raise ValueError(f"Dimensiones incompatibles: {dimension} y {len(estado.vector)}")
+            conjugado = [peso * complex(a).conjugate() for a in estado.vector]
+            for fila, a in zip(matriz, estado.vector):
+                if a:
+                    for j, c in enumerate(conjugado):
+                        fila[j] += a * c
+        return cls(id, matriz, estados[0].base)
+
+    @property
+    def num_qubits(self) -> int:
+        """Número de qubits del sistema."""
+        return numero_qubits(len(self.matriz))
+
+    def medir(self) -> Dict[str, float]:
+        """
+        Calcula las probabilidades de medición para cada estado base.
+
+        Returns:
+            Diccionario con las probabilidades (la diagonal de la matriz), con las
+            mismas claves que `EstadoCuantico.medir`
+        """
+        return {str(i): complex(self.matriz[i][i]).real for i in range(len(self.matriz))}
+
+    def pureza(self) -> float:
+        """
+        Calcula Tr(rho^2): 1 para estados puros, 1/d para el estado máximamente mixto.
+        """
+        # Tr(rho^2) = sum_ij |rho_ij|^2 al ser rho hermítica
+        return sum(abs(c) ** 2 for fila in self.matriz for c in fila)
+
+    def traza_parcial(self, conservar: Sequence[int]) -> "MatrizDensidad":
+        """
+        Traza los qubits que no están en `conservar`.
+
+        Args:
+            conservar: Qubits que se mantienen (0 = qubit más significativo), en el
+                orden en que aparecerán en la matriz reducida
+
+        Returns:
+            Matriz densidad reducida de 2^len(conservar) x 2^len(conservar)
+        """
+        n = self.num_qubits
+        if len(set(conservar)) != len(conservar) or any(not 0 <= q < n for q in conservar):
+            raise ValueError(f"Qubits no válidos {list(conservar)} para un sistema de {n} qubits")
+        trazados = [q for q in range(n) if q not in conservar]
+
+        conservados = desplazamientos_qubits(list(conservar), n)
+        sumandos = desplazamientos_qubits(trazados, n)
+        reducida = [[sum(self.matriz[a | b][c | b] for b in sumandos) for c in conservados]
+                    for a in conservados]
+        return MatrizDensidad(f"{self.id}_traza", reducida, self.base)
+
+    def __str__(self) -> str:
+        """
+        Representación legible de la matriz densidad.
+        """
+        return f"{self.id}: matriz densidad {len(self.matriz)}x{len(self.matriz)} en base {self.base}"
+
+    def __repr__(self) -> str:
+        return f"MatrizDensidad(id={self.id!r}, matriz={self.matriz!r}, base={self.base!r})"
+
+    def to_dict(self) -> Dict[str, Union[str, List[List[complex]]]]:
+        """
+        Convierte la matriz densidad a un diccionario para serialización.
+        """
+        return {
+            "id": self.id,
+            "matriz": self.matriz,
+            "base": self.base
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Union[str, List[List[complex]]]]):
+        """
+        Crea una MatrizDensidad a partir de un diccionario.
+        """
+        return cls(data["id"], data["matriz"], data["base"])
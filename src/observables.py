@@ -0,0 +1,146 @@
+from typing import List, Sequence, Tuple
+
+_FASES_Y = (1, 1j, -1, -1j)  # i^k para k = número de Y (mod 4)
+
+def numero_qubits(dimension: int) -> int:
+    """
+    Devuelve el número de qubits de un vector de la dimensión dada.
+
+    Raises:
+        ValueError: Si la dimensión no es una potencia de 2
+    """
+    n = dimension.bit_length() - 1
+    if dimension < 1 or 1 << n != dimension:
+        raise ValueError(f"La dimensión {dimension} no corresponde a un sistema de qubits")
+    return n
+
+def mascaras_pauli(pauli: str) -> Tuple[int, int, complex]:
+    """
+    Convierte una cadena de Pauli (ej. "XZI") en máscaras de bits.
+
+    El primer carácter actúa sobre el qubit más significativo, de modo que el
+    índice i de la base computacional se lee como su representación binaria.
+
+    Returns:
+        Tupla (mascara_x, mascara_z, fase) tal que P|i> = fase * (-1)^popcount(i & mascara_z) |i ^ mascara_x>
+
+    Raises:
+        ValueError: Si la cadena contiene caracteres distintos de I, X, Y, Z
+    """
+    mascara_x = mascara_z = 0
+    num_y = 0
+    for c in pauli.upper():
+        mascara_x <<= 1
+        mascara_z <<= 1
+        if c == "X":
+            mascara_x |= 1
+        elif c == "Z":
+            mascara_z |= 1
+        elif c == "Y":
+            mascara_x |= 1
+            mascara_z |= 1
+            num_y += 1
+        elif c != "I":
+            raise ValueError(f"Carácter de Pauli no válido: '{c}'")
+    return mascara_x, mascara_z, _FASES_Y[num_y % 4]
+
+def valor_esperado_pauli(vector: Sequence[complex], pauli: str) -> float:
+    """
+    Calcula <psi|P|psi> para una cadena de Pauli sin construir su matriz.
+
+    Recorre el vector una sola vez usando operaciones de bits: O(2^n).
+
+    Args:
+        vector: Amplitudes del estado
+        pauli: Cadena de Pauli con un carácter por qubit (ej. "ZZ", "XIY")
+
+    Returns:
+        El valor esperado (real, al ser P hermítico)
+    """
+    if len(pauli) != numero_qubits(len(vector)):
+        raise ValueError(f"La cadena '{pauli}' no coincide con un estado de {len(vector)} amplitudes")
+    return _valor_esperado_mascaras(vector, *mascaras_pauli(pauli))
+
+def _valor_esperado_mascaras(vector: Sequence[complex], mascara_x: int, mascara_z: int, fase: complex) -> float:
+    """Núcleo de `valor_esperado_pauli` con las máscaras ya calculadas."""
+    total = 0j
+    if mascara_x == 0:
+        # Observable diagonal: sólo contribuyen las probabilidades
+        for i, amplitud in enumerate(vector):
+            prob = abs(amplitud) ** 2
+            total += -prob if bin(i & mascara_z).count("1") & 1 else prob
+    else:
+        for i, amplitud in enumerate(vector):
+            termino = complex(vector[i ^ mascara_x]).conjugate() * amplitud
+            total += -termino if bin(i & mascara_z).count("1") & 1 else termino
+    return (fase * total).real
+
+def valor_esperado_matriz(vector: Sequence[complex], matriz: Sequence[Sequence[complex]]) -> complex:
+    """
+    Calcula <psi|M|psi> sin crear un estado intermedio.
+
+    Args:
+        vector: Amplitudes del estado
+        matriz: Matriz cuadrada de la misma dimensión que el vector
+    """
+    if len(vector) != len(matriz):
+        raise ValueError(f"Dimensiones incompatibles: operador {len(matriz)}x{len(matriz)}, estado {len(vector)}")
+    return sum(complex(a).conjugate() * sum(f * v for f, v in zip(fila, vector))
+               for a, fila in zip(vector, matriz))
+
+def producto_interno(bra: Sequence[complex], ket: Sequence[complex]) -> complex:
+    """
+    Calcula <bra|ket>.
+
+    Raises:
+        ValueError: Si los vectores tienen dimensiones distintas
+    """
+    if len(bra) != len(ket):
+        raise ValueError(f"Dimensiones incompatibles: {len(bra)} y {len(ket)}")
+    return sum(complex(a).conjugate() * b for a, b in zip(bra, ket))
+
+def fidelidad(vector_a: Sequence[complex], vector_b: Sequence[complex]) -> float:
+    """Calcula la fidelidad |<a|b>|^2 entre dos estados puros."""
+    return abs(producto_interno(vector_a, vector_b)) ** 2
+
+def valor_esperado(vector: Sequence[complex], observable) -> complex:
+    """
+    Calcula el valor esperado de un observable sobre un vector de amplitudes.
+
+    Args:
+        vector: Amplitudes del estado
+        observable: Cadena de Pauli (str) u objeto con atributo `matriz` (ej. OperadorCuantico)
+
+    Returns:
+        float para cadenas de Pauli, complex para matrices arbitrarias
+    """
+    if isinstance(observable, str):
+        return valor_esperado_pauli(vector, observable)
+    return valor_esperado_matriz(vector, observable.matriz)
+
+def nombre_observable(observable) -> str:
+    """Nombre con el que se reporta un observable en los resultados."""
+    return observable if isinstance(observable, str) else observable.nombre
+
+def tabla_valores_esperados(vectores: Sequence[Sequence[complex]], observables: Sequence) -> List[List[complex]]:
+    """
+    Evalúa todos los observables sobre todos los vectores.
+
+    Las máscaras de cada cadena de Pauli se calculan una sola vez para todo el lote.
+
+    Returns:
+        Matriz resultado[i][j] = valor esperado del observable j en el vector i
+    """
+    evaluadores = []
+    for obs in observables:
+        if isinstance(obs, str):
+            mascaras = mascaras_pauli(obs)
+            def evaluar(vector, obs=obs, mascaras=mascaras):
+                if len(obs) != numero_qubits(len(vector)):
+                    raise ValueError(f"La cadena '{obs}' no coincide con un estado de {len(vector)} amplitudes")
+                return _valor_esperado_mascaras(vector, *mascaras)
+        else:
+            def evaluar(vector, matriz=obs.matriz):
+                return valor_esperado_matriz(vector, matriz)
+        evaluadores.append(evaluar)
+    return [[evaluar(vector) for evaluar in evaluadores] for vector in vectores]
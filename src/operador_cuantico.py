@@ -1,6 +1,11 @@
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
 import math
 from estado_cuantico import EstadoCuantico
+from observables import numero_qubits
+from backends import obtener_backend
+
+if TYPE_CHECKING:
+    from matriz_densidad import MatrizDensidad
 
 class OperadorCuantico:
     def __init__(self, nombre: str, matriz: List[List[complex]]):
@@ -20,36 +25,149 @@ class OperadorCuantico:
             if len(fila) != n:
                 raise ValueError("La matriz del operador debe ser cuadrada")
     
-    def aplicar(self, estado: EstadoCuantico) -> EstadoCuantico:
+    def aplicar(self, estado: EstadoCuantico, qubits: Optional[Sequence[int]] = None,
+                backend: Optional[str] = None, en_sitio: bool = False) -> EstadoCuantico:
         """
         Aplica el operador a un estado cuántico, devolviendo un nuevo estado.
         
         Args:
             estado: Estado cuántico a transformar
+            qubits: Qubits sobre los que actúa el operador (si None, actúa sobre el estado completo).
+                El qubit 0 es el más significativo del índice de la base computacional.
+            backend: Backend de cálculo para esta llamada (si None, el global; ver `backends`)
+            en_sitio: Si es True, modifica `estado.vector` directamente y devuelve el mismo
+                estado (sin reservar un vector ni un EstadoCuantico nuevos). Con
+                qubits=None el producto completo se calcula aparte y se copia al vector.
             
         Returns:
             Nuevo estado cuántico resultante de la aplicación del operador
+            (o el propio `estado` si en_sitio es True)
         """
-        # Verificar que las dimensiones coincidan
-        if len(estado.vector) != len(self.matriz):
-            raise ValueError(f"Dimensiones incompatibles: operador {len(self.matriz)}x{len(self.matriz)}, estado {len(estado.vector)}")
-            
-        # Multiplicación matriz-vector
-        nuevo_vector = []
-        for fila in self.matriz:
-            componente = sum(f * v for f, v in zip(fila, estado.vector))
-            nuevo_vector.append(componente)
+        if en_sitio and qubits is not None:
+            aplicar_matriz_local_en_sitio(self.matriz, estado.vector, qubits, backend)
+            return estado
+        
+        if qubits is not None:
+            nuevo_vector = aplicar_matriz_local(self.matriz, estado.vector, qubits, backend)
+        else:
+            # Verificar que las dimensiones coincidan
+            if len(estado.vector) != len(self.matriz):
+                raise ValueError(f"Dimensiones incompatibles: operador {len(self.matriz)}x{len(self.matriz)}, estado {len(estado.vector)}")
+                
+            # Multiplicación matriz-vector
+            nuevo_vector = obtener_backend(backend).aplicar_matriz(self.matriz, estado.vector)
+            if en_sitio:
+                estado.vector[:] = nuevo_vector
+                return estado
             
         # Crear nuevo estado con el mismo ID + sufijo del operador
         nuevo_id = f"{estado.id}_{self.nombre}"
         return EstadoCuantico(nuevo_id, nuevo_vector, estado.base)
     
+    def aplicar_densidad(self, rho: "MatrizDensidad", qubits: Optional[Sequence[int]] = None,
+                         backend: Optional[str] = None) -> "MatrizDensidad":
+        """
+        Aplica el operador a una matriz densidad: rho -> U rho U†.
+        
+        Usa la misma contracción local que `aplicar` (ver `conjugar_matriz_local`).
+        
+        Args:
+            rho: Matriz densidad a transformar
+            qubits: Qubits sobre los que actúa el operador (si None, sobre todo el sistema)
+            backend: Backend de cálculo para esta llamada (si None, el global)
+            
+        Returns:
+            Nueva matriz densidad resultante
+        """
+        dimension = len(rho.matriz)
+        if qubits is None and dimension != len(self.matriz):
+            raise ValueError(f"Dimensiones incompatibles: operador {len(self.matriz)}x{len(self.matriz)}, matriz densidad {dimension}x{dimension}")
+        from matriz_densidad import MatrizDensidad
+        
+        nueva = conjugar_matriz_local(self.matriz, rho.matriz, qubits, backend)
+        return MatrizDensidad(f"{rho.id}_{self.nombre}", nueva, rho.base)
+    
     def __str__(self) -> str:
         return f"Operador {self.nombre} (matriz {len(self.matriz)}x{len(self.matriz)})"
     
     def __repr__(self) -> str:
         return f"OperadorCuantico(nombre={self.nombre!r}, matriz={self.matriz!r})"
 
+def _validar_qubits(matriz: List[List[complex]], vector: Sequence[complex], qubits: Sequence[int]) -> int:
+    """Comprueba que la matriz y los qubits destino encajan con el vector; devuelve n."""
+    n = numero_qubits(len(vector))
+    k = len(qubits)
+    if len(matriz) != 1 << k:
+        raise ValueError(f"Dimensiones incompatibles: operador {len(matriz)}x{len(matriz)} para {k} qubit(s)")
+    if len(set(qubits)) != k or any(not 0 <= q < n for q in qubits):
+        raise ValueError(f"Qubits no válidos {list(qubits)} para un estado de {n} qubits")
+    return n
+
+def aplicar_matriz_local(matriz: List[List[complex]], vector: Sequence[complex], qubits: Sequence[int],
+                         backend: Optional[str] = None) -> List[complex]:
+    """
+    Aplica una matriz de k qubits sobre los qubits indicados de un vector de n qubits.
+    
+    Sólo se recorre el vector una vez por bloque de 2^k amplitudes: O(2^n * 2^k),
+    sin construir la matriz completa de 2^n x 2^n.
+    
+    Args:
+        matriz: Matriz de 2^k x 2^k; su bit más significativo corresponde a qubits[0]
+        vector: Amplitudes del estado (2^n elementos)
+        qubits: Índices de los k qubits destino (0 = qubit más significativo)
+        backend: Backend de cálculo (si None, el global)
+        
+    Returns:
+        Nueva lista de amplitudes
+    """
+    n = _validar_qubits(matriz, vector, qubits)
+    return obtener_backend(backend).aplicar_matriz_local(matriz, vector, qubits, n)
+
+def aplicar_matriz_local_en_sitio(matriz: List[List[complex]], vector: List[complex], qubits: Sequence[int],
+                                  backend: Optional[str] = None) -> None:
+    """
+    Como `aplicar_matriz_local`, pero sobrescribe `vector` en lugar de devolver uno nuevo.
+    
+    Para secuencias largas de puertas evita reservar un vector de 2^n por puerta:
+    el backend sólo usa búferes auxiliares que reutiliza entre llamadas.
+    """
+    n = _validar_qubits(matriz, vector, qubits)
+    obtener_backend(backend).aplicar_matriz_local_en_sitio(matriz, vector, list(qubits), n)
+
+def conjugar_matriz_local(matriz: List[List[complex]], rho: List[List[complex]],
+                          qubits: Optional[Sequence[int]] = None, backend: Optional[str] = None) -> List[List[complex]]:
+    """
+    Calcula K rho K† aplicando K sobre los qubits indicados, sin construir K completa.
+    
+    rho se trata como un vector plano de 2n qubits sobre el que se aplican en el
+    sitio K (qubits de fila) y conj(K) (qubits de columna) con los núcleos del
+    backend. No exige que el resultado tenga traza 1, por lo que sirve también
+    para operadores de Kraus.
+    
+    Args:
+        matriz: Matriz K de 2^k x 2^k
+        rho: Matriz densidad de 2^n x 2^n
+        qubits: Qubits sobre los que actúa K (si None, sobre todo el sistema)
+        backend: Backend de cálculo (si None, el global)
+        
+    Returns:
+        Nueva matriz (lista de listas)
+    """
+    return aplicar_kraus_local([matriz], rho, qubits, backend)
+
+def aplicar_kraus_local(matrices: Sequence[List[List[complex]]], rho: List[List[complex]],
+                        qubits: Optional[Sequence[int]] = None, backend: Optional[str] = None) -> List[List[complex]]:
+    """
+    Calcula sum_k K_k rho K_k† (ver `conjugar_matriz_local`) acumulando los términos
+    en el backend, sin construir una matriz de listas por operador.
+    """
+    n = numero_qubits(len(rho))
+    if qubits is None:
+        qubits = range(n)
+    for matriz in matrices:
+        _validar_qubits(matriz, rho, qubits)
+    return obtener_backend(backend).aplicar_kraus_local(matrices, rho, list(qubits), n)
+
 # Operadores predefinidos
 def crear_operador_x() -> OperadorCuantico:
     """Crea la puerta X (NOT cuántico)"""
@@ -71,4 +189,12 @@ def crear_operador_z() -> OperadorCuantico:
     return OperadorCuantico("Z", [
         [1, 0],
         [0, -1]
-    ])
\ No newline at end of file
+    ])
+
+def operadores_predefinidos() -> Dict[str, OperadorCuantico]:
+    """Devuelve los operadores predefinidos indexados por nombre"""
+    return {
+        "X": crear_operador_x(),
+        "H": crear_operador_h(),
+        "Z": crear_operador_z()
+    }
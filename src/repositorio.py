@@ -1,12 +1,30 @@
-import json
-from typing import Dict, List, Optional
+import math
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from estado_cuantico import EstadoCuantico
 from operador_cuantico import OperadorCuantico
+import observables
 
 class RepositorioDeEstados:
     def __init__(self):
         """Inicializa un repositorio vacío de estados cuánticos."""
         self.estados: Dict[str, EstadoCuantico] = {}
+        # (padre, operador) -> siguiente sufijo numérico a probar en los IDs automáticos
+        self._contadores: Dict[Tuple[str, str], int] = {}
+        self._limpiar_indices()
+    
+    def _limpiar_indices(self) -> None:
+        """Vacía los índices secundarios."""
+        # Índices secundarios, mantenidos en cada inserción (dict usado como conjunto ordenado)
+        self._por_base: Dict[str, Dict[str, None]] = {}
+        self._por_dimension: Dict[int, Dict[str, None]] = {}
+        self._por_origen: Dict[str, Dict[str, None]] = {}
+        self._por_cadena: Dict[Tuple[str, ...], Dict[str, None]] = {}
+        self._hijos: Dict[str, Dict[str, None]] = {}
+        # id -> (padre, operador, origen, cadena de operadores desde el origen)
+        self._procedencia: Dict[str, Tuple[Optional[str], Optional[str], str, Tuple[str, ...]]] = {}
+        # Orden de inserción con acceso O(1) a la posición de cada ID (para la paginación)
+        self._orden: List[str] = []
+        self._posicion: Dict[str, int] = {}
     
     def agregar_estado(self, id: str, vector: List[complex], base: str = "computacional") -> None:
         """
@@ -23,7 +41,281 @@ class RepositorioDeEstados:
         if id in self.estados:
             raise ValueError(f"Ya existe un estado con ID '{id}'")
             
-        self.estados[id] = EstadoCuantico(id, vector, base)
+        self._registrar(EstadoCuantico(id, vector, base))
+    
+    def agregar_estados(self, ids: Sequence[str], vectores, base: str = "computacional") -> None:
+        """
+        Agrega muchos estados de una sola vez (carga masiva).
+        
+        La normalización se verifica para todo el lote en una sola pasada (con
+        operaciones vectorizadas de NumPy si `vectores` es un array) y la operación
+        es atómica: si algún estado es inválido no se agrega ninguno.
+        
+        Args:
+            ids: Secuencia de identificadores, uno por fila de `vectores`
+            vectores: Matriz de amplitudes (lista de listas o array 2D de NumPy)
+            base: Base en la que están expresados todos los estados
+            
+        Raises:
+            ValueError: Si hay IDs repetidos, vectores vacíos o no normalizados
+        """
+        ids = [str(id) for id in ids]
+        if len(ids) != len(vectores):
+            raise ValueError(f"Se esperaban {len(ids)} vectores y se recibieron {len(vectores)}")
+        if hasattr(vectores, "tolist"):
+            errores = _validar_lote_numpy(ids, vectores)
+            if errores:
+                raise ValueError("Estados no válidos en el lote: " + "; ".join(errores))
+            self._agregar_lotes({base: (ids, vectores.tolist())}, validados=True)
+            return
+        
+        self._agregar_lotes({base: (ids, [list(v) for v in vectores])})
+    
+    def exportar_estados(self, ids: Optional[Sequence[str]] = None) -> Tuple[List[str], List[List[complex]]]:
+        """
+        Exporta estados en formato columnar: una lista de IDs y una matriz de amplitudes.
+        
+        Args:
+            ids: IDs a exportar (si None, se exportan todos en orden de inserción)
+            
+        Returns:
+            Tupla (ids, vectores) donde vectores[i] son las amplitudes de ids[i]
+            
+        Raises:
+            ValueError: Si alguno de los IDs no existe
+        """
+        if ids is None:
+            ids = list(self.estados)
+        vectores = []
+        for id in ids:
+            estado = self.obtener_estado(id)
+            if estado is None:
+                raise ValueError(f"No existe estado con ID '{id}'")
+            vectores.append(list(estado.vector))
+        return list(ids), vectores
+    
+    def exportar_csv(self, archivo: str) -> None:
+        """
+        Guarda todos los estados en un CSV con una fila por estado.
+        
+        Columnas: id, base y una columna por amplitud (amp0, amp1, ...).
+        
+        Args:
+            archivo: Ruta del archivo CSV
+        """
+        import csv
+        
+        dimension = max((len(e.vector) for e in self.estados.values()), default=0)
+        with open(archivo, 'w', newline='') as f:
+            escritor = csv.writer(f)
+            escritor.writerow(["id", "base"] + [f"amp{i}" for i in range(dimension)])
+            for estado in self.estados.values():
+                escritor.writerow([estado.id, estado.base] + [repr(complex(a)) for a in estado.vector])
+    
+    def importar_csv(self, archivo: str) -> None:
+        """
+        Agrega los estados de un CSV generado por `exportar_csv`.
+        
+        Los estados se agrupan por base y se validan por lotes con `agregar_estados`.
+        
+        Args:
+            archivo: Ruta del archivo CSV
+        """
+        import csv
+        
+        lotes: Dict[str, Tuple[List[str], List[List[complex]]]] = {}
+        with open(archivo, 'r', newline='') as f:
+            lector = csv.reader(f)
+            next(lector, None)  # Cabecera
+            for fila in lector:
+                if not fila:
+                    continue
+                ids, vectores = lotes.setdefault(fila[1], ([], []))
+                ids.append(fila[0])
+                vectores.append([complex(c) for c in fila[2:] if c])
+        
+        self._agregar_lotes(lotes)
+    
+    def exportar_npy(self, archivo: str) -> None:
+        """
+        Guarda todos los estados en un archivo .npz de NumPy (requiere numpy).
+        
+        El archivo contiene los arrays `ids`, `bases` y `amplitudes` (2D, complex128).
+        Todos los estados deben tener la misma dimensión.
+        
+        Args:
+            archivo: Ruta del archivo .npz
+        """
+        import numpy as np
+        
+        ids, vectores = self.exportar_estados()
+        if len({len(v) for v in vectores}) > 1:
+            raise ValueError("Todos los estados deben tener la misma dimensión para exportar a NumPy")
+        bases = [self.estados[id].base for id in ids]
+        amplitudes = np.array(vectores, dtype=np.complex128) if ids else np.empty((0, 0), dtype=np.complex128)
+        np.savez(archivo, ids=np.array(ids, dtype=str), bases=np.array(bases, dtype=str),
+                 amplitudes=amplitudes)
+    
+    def importar_npy(self, archivo: str) -> None:
+        """
+        Agrega los estados de un archivo .npz generado por `exportar_npy` (requiere numpy).
+        
+        Args:
+            archivo: Ruta del archivo .npz
+        """
+        import numpy as np
+        
+        with np.load(archivo) as datos:
+            ids = datos["ids"].tolist()
+            bases = datos["bases"].tolist()
+            amplitudes = datos["amplitudes"]
+        
+        # Validación vectorizada de todo el lote antes de convertir a listas
+        errores = _validar_lote_numpy(ids, amplitudes)
+        if errores:
+            raise ValueError("Estados no válidos en el lote: " + "; ".join(errores))
+        
+        lotes: Dict[str, Tuple[List[str], List[List[complex]]]] = {}
+        for id, base, vector in zip(ids, bases, amplitudes.tolist()):
+            lote_ids, lote_vectores = lotes.setdefault(base, ([], []))
+            lote_ids.append(id)
+            lote_vectores.append(vector)
+        self._agregar_lotes(lotes, validados=True)
+    
+    def _agregar_lotes(self, lotes: Dict[str, Tuple[List[str], List[List[complex]]]],
+                       validados: bool = False) -> None:
+        """
+        Agrega lotes agrupados por base de forma atómica.
+        
+        Args:
+            lotes: {base: (ids, vectores)}
+            validados: Si True, los vectores ya se verificaron (p. ej. con
+                `_validar_lote_numpy`) y sólo se comprueban los IDs
+        """
+        todos = [id for ids, _ in lotes.values() for id in ids]
+        vistos = set()
+        for id in todos:
+            if id in self.estados or id in vistos:
+                raise ValueError(f"Ya existe un estado con ID '{id}'")
+            vistos.add(id)
+        errores = [] if validados else [e for ids, vectores in lotes.values() for e in _validar_lote(ids, vectores)]
+        if errores:
+            raise ValueError("Estados no válidos en el lote: " + "; ".join(errores))
+        for base, (ids, vectores) in lotes.items():
+            for id, vector in zip(ids, vectores):
+                self._registrar(EstadoCuantico._sin_validar(id, vector, base))
+    
+    def _registrar(self, estado: EstadoCuantico, padre: Optional[str] = None, operador: Optional[str] = None) -> None:
+        """
+        Inserta un estado y actualiza los índices secundarios.
+        
+        Args:
+            estado: Estado a insertar (si su ID ya existe, lo reemplaza)
+            padre: ID del estado del que deriva (None si es un estado raíz)
+            operador: Nombre del operador aplicado al padre
+        """
+        if estado.id in self.estados:
+            self._desindexar(estado.id)
+        else:
+            self._posicion[estado.id] = len(self._orden)
+            self._orden.append(estado.id)
+        self.estados[estado.id] = estado
+        
+        if padre is not None and padre in self._procedencia:
+            _, _, origen, cadena = self._procedencia[padre]
+            cadena = cadena + (operador,)
+            self._hijos.setdefault(padre, {})[estado.id] = None
+        else:
+            padre, operador, origen, cadena = None, None, estado.id, ()
+        self._procedencia[estado.id] = (padre, operador, origen, cadena)
+        
+        self._por_base.setdefault(estado.base, {})[estado.id] = None
+        self._por_dimension.setdefault(len(estado.vector), {})[estado.id] = None
+        self._por_origen.setdefault(origen, {})[estado.id] = None
+        self._por_cadena.setdefault(cadena, {})[estado.id] = None
+    
+    def _desindexar(self, id: str) -> None:
+        """Elimina un estado de los índices secundarios (no del repositorio)."""
+        estado = self.estados[id]
+        padre, _, origen, cadena = self._procedencia.pop(id)
+        for indice, clave in ((self._por_base, estado.base), (self._por_dimension, len(estado.vector)),
+                              (self._por_origen, origen), (self._por_cadena, cadena), (self._hijos, padre)):
+            grupo = indice.get(clave)
+            if grupo is not None:
+                grupo.pop(id, None)
+                if not grupo:
+                    del indice[clave]
+    
+    def buscar(self, base: Optional[str] = None, num_qubits: Optional[int] = None,
+               dimension: Optional[int] = None, origen: Optional[str] = None,
+               derivado_de: Optional[str] = None, cadena: Optional[Sequence[str]] = None) -> List[EstadoCuantico]:
+        """
+        Busca estados usando los índices secundarios, sin recorrer todo el repositorio.
+        
+        Todos los criterios son opcionales y se combinan con "y". El coste es
+        proporcional al tamaño del menor conjunto candidato, no al del repositorio.
+        
+        Args:
+            base: Base en la que está expresado el estado
+            num_qubits: Número de qubits (equivale a dimension = 2^num_qubits)
+            dimension: Longitud del vector de amplitudes
+            origen: ID del estado raíz del que procede (él mismo incluido)
+            derivado_de: ID de un estado del que desciende a través de aplicar_operador
+            cadena: Secuencia exacta de operadores aplicados desde el origen (ej. ["H", "X"])
+            
+        Returns:
+            Lista de estados que cumplen todos los criterios, en orden de inserción
+        """
+        if num_qubits is not None:
+            if dimension is not None and dimension != 1 << num_qubits:
+                return []
+            dimension = 1 << num_qubits
+        
+        candidatos = []
+        if base is not None:
+            candidatos.append(self._por_base.get(base, {}))
+        if dimension is not None:
+            candidatos.append(self._por_dimension.get(dimension, {}))
+        if origen is not None:
+            candidatos.append(self._por_origen.get(origen, {}))
+        if cadena is not None:
+            candidatos.append(self._por_cadena.get(tuple(cadena), {}))
+        if derivado_de is not None:
+            candidatos.append(self._descendientes(derivado_de))
+        if not candidatos:
+            return list(self.estados.values())
+        
+        candidatos.sort(key=len)
+        menor, resto = candidatos[0], candidatos[1:]
+        # Los reindexados (en el sitio, cambio de base) quedan al final de su grupo:
+        # ordenar por posición de inserción
+        ids = sorted((id for id in menor if all(id in grupo for grupo in resto)), key=self._posicion.__getitem__)
+        return [self.estados[id] for id in ids]
+    
+    def procedencia(self, id: str) -> Dict[str, object]:
+        """
+        Devuelve de dónde procede un estado.
+        
+        Returns:
+            Diccionario con "padre", "operador", "origen" y "cadena" (lista de operadores)
+            
+        Raises:
+            ValueError: Si no existe el estado con el ID especificado
+        """
+        self._requerir_estado(id)
+        padre, operador, origen, cadena = self._procedencia[id]
+        return {"padre": padre, "operador": operador, "origen": origen, "cadena": list(cadena)}
+    
+    def _descendientes(self, id: str) -> Dict[str, None]:
+        """Recorre el índice de hijos en anchura: O(número de descendientes)."""
+        resultado: Dict[str, None] = dict.fromkeys(self._hijos.get(id, ()))
+        pendientes = list(resultado)
+        for actual in pendientes:
+            for hijo in self._hijos.get(actual, ()):
+                if hijo not in resultado:
+                    resultado[hijo] = None
+                    pendientes.append(hijo)
+        return resultado
     
     def obtener_estado(self, id: str) -> Optional[EstadoCuantico]:
         """
@@ -37,6 +329,13 @@ class RepositorioDeEstados:
         """
         return self.estados.get(id)
     
+    def _requerir_estado(self, id: str) -> EstadoCuantico:
+        """Como `obtener_estado`, pero lanza ValueError si el estado no existe."""
+        estado = self.obtener_estado(id)
+        if estado is None:
+            raise ValueError(f"No existe estado con ID '{id}'")
+        return estado
+    
     def listar_estados(self) -> List[str]:
         """
         Devuelve una lista con las representaciones en string de todos los estados.
@@ -46,7 +345,49 @@ class RepositorioDeEstados:
         """
         return [str(estado) for estado in self.estados.values()]
     
-    def aplicar_operador(self, id_estado: str, operador: OperadorCuantico, nuevo_id: str = None) -> EstadoCuantico:
+    def iterar_estados(self, k: int = 3) -> Iterator[str]:
+        """
+        Genera de forma perezosa un resumen truncado de cada estado.
+        
+        A diferencia de `listar_estados`, no construye la lista completa ni formatea
+        todas las amplitudes (ver `EstadoCuantico.resumen`).
+        
+        Args:
+            k: Número de amplitudes a mostrar en cada extremo del vector
+        """
+        for estado in self.estados.values():
+            yield estado.resumen(k)
+    
+    def listar_pagina(self, cursor: Optional[str] = None, tamano: int = 20, k: int = 3) -> Tuple[List[str], Optional[str]]:
+        """
+        Devuelve una página de resúmenes de estados en orden de inserción.
+        
+        Args:
+            cursor: Cursor devuelto por la página anterior (None para la primera página)
+            tamano: Número máximo de estados por página
+            k: Número de amplitudes a mostrar en cada extremo del vector
+            
+        Returns:
+            Tupla (resúmenes, cursor_siguiente); cursor_siguiente es None en la última página
+            
+        Raises:
+            ValueError: Si el cursor no es válido o el tamaño no es positivo
+        """
+        if tamano < 1:
+            raise ValueError("El tamaño de página debe ser positivo")
+        inicio = 0
+        if cursor is not None:
+            if cursor not in self._posicion:
+                raise ValueError(f"Cursor no válido: '{cursor}'")
+            inicio = self._posicion[cursor] + 1
+        
+        ids = self._orden[inicio:inicio + tamano]
+        pagina = [self.estados[id].resumen(k) for id in ids]
+        siguiente = ids[-1] if ids and inicio + tamano < len(self._orden) else None
+        return pagina, siguiente
+    
+    def aplicar_operador(self, id_estado: str, operador: OperadorCuantico, nuevo_id: str = None,
+                         qubits: Optional[Sequence[int]] = None, en_sitio: bool = False) -> EstadoCuantico:
         """
         Aplica un operador cuántico a un estado y guarda el resultado.
         
@@ -54,37 +395,58 @@ class RepositorioDeEstados:
             id_estado: ID del estado a transformar
             operador: Operador cuántico a aplicar
             nuevo_id: ID para el nuevo estado (si None, se genera automáticamente)
+            qubits: Qubits sobre los que actúa el operador (si None, sobre todo el estado)
+            en_sitio: Si es True, transforma el estado guardado sin crear uno nuevo
+                (el estado conserva su ID, así que no admite nuevo_id; el operador se
+                añade a su cadena de procedencia)
             
         Returns:
-            El nuevo estado cuántico resultante
+            El nuevo estado cuántico resultante (o el mismo estado si en_sitio es True)
             
         Raises:
-            ValueError: Si no existe el estado con el ID especificado
+            ValueError: Si no existe el estado con el ID especificado, si nuevo_id ya
+                existe en el repositorio o si se pasa nuevo_id junto con en_sitio
         """
         estado = self.obtener_estado(id_estado)
         if estado is None:
             raise ValueError(f"No existe estado con ID '{id_estado}'")
             
-        nuevo_estado = operador.aplicar(estado)
+        if en_sitio:
+            if nuevo_id is not None:
+                raise ValueError("nuevo_id no se puede usar con en_sitio: el estado conserva su ID")
+            operador.aplicar(estado, qubits, en_sitio=True)
+            self._reindexar_cadena(estado.id, operador.nombre)
+            return estado
+        
+        if nuevo_id is not None and nuevo_id in self.estados:
+            # Sobrescribir un estado dejaría a sus descendientes con una procedencia
+            # obsoleta (y podría cerrar un ciclo en el grafo de procedencia)
+            raise ValueError(f"Ya existe un estado con ID '{nuevo_id}'")
+        
+        nuevo_estado = operador.aplicar(estado, qubits)
         
         if nuevo_id is not None:
             nuevo_estado.id = nuevo_id
         elif f"{estado.id}_{operador.nombre}" in self.estados:
-            # Si el ID generado ya existe, añadir un número
-            i = 1
+            # Si el ID generado ya existe, añadir un número. El contador por
+            # (padre, operador) evita volver a probar desde 1 en cada repetición.
+            clave = (estado.id, operador.nombre)
+            i = self._contadores.get(clave, 1)
             while f"{estado.id}_{operador.nombre}_{i}" in self.estados:
                 i += 1
             nuevo_estado.id = f"{estado.id}_{operador.nombre}_{i}"
+            self._contadores[clave] = i + 1
         
-        self.estados[nuevo_estado.id] = nuevo_estado
+        self._registrar(nuevo_estado, estado.id, operador.nombre)
         return nuevo_estado
     
-    def medir_estado(self, id: str) -> Dict[str, float]:
+    def medir_estado(self, id: str, base: Optional[str] = None) -> Dict[str, float]:
         """
         Mide un estado cuántico y devuelve las probabilidades de cada resultado.
         
         Args:
             id: ID del estado a medir
+            base: Base en la que se mide (si None, la del estado)
             
         Returns:
             Diccionario con las probabilidades de cada resultado de medición
@@ -96,16 +458,140 @@ class RepositorioDeEstados:
         if estado is None:
             raise ValueError(f"No existe estado con ID '{id}'")
             
-        return estado.medir()
+        return estado.medir(base=base)
     
-    def guardar(self, archivo: str) -> None:
+    def cambiar_base(self, id: str, base: str) -> EstadoCuantico:
+        """
+        Reexpresa un estado en otra base en el sitio y actualiza el índice por base.
+        
+        Args:
+            id: ID del estado
+            base: Base destino (ver `EstadoCuantico.cambiar_base`)
+            
+        Returns:
+            El estado modificado
+            
+        Raises:
+            ValueError: Si no existe el estado o la base no es válida
+        """
+        estado = self._requerir_estado(id)
+        anterior = estado.base
+        estado.cambiar_base(base)
+        self._reindexar_base(id, anterior)
+        return estado
+    
+    def _reindexar_cadena(self, id: str, operador: str) -> None:
+        """Añade un operador aplicado en el sitio a la cadena del estado y lo mueve en el índice por cadena."""
+        padre, operador_padre, origen, cadena = self._procedencia[id]
+        grupo = self._por_cadena.get(cadena)
+        if grupo is not None:
+            grupo.pop(id, None)
+            if not grupo:
+                del self._por_cadena[cadena]
+        cadena = cadena + (operador,)
+        self._procedencia[id] = (padre, operador_padre, origen, cadena)
+        self._por_cadena.setdefault(cadena, {})[id] = None
+    
+    def _reindexar_base(self, id: str, anterior: str) -> None:
+        """Mueve un estado de `anterior` a su base actual en el índice por base."""
+        grupo = self._por_base.get(anterior)
+        if grupo is not None:
+            grupo.pop(id, None)
+            if not grupo:
+                del self._por_base[anterior]
+        self._por_base.setdefault(self.estados[id].base, {})[id] = None
+    
+    def colapsar_estado(self, id: str, qubits: Optional[Sequence[int]] = None, semilla: Optional[int] = None) -> str:
+        """
+        Mide un estado de forma proyectiva, colapsándolo en el sitio.
+        
+        Args:
+            id: ID del estado a medir
+            qubits: Qubits a medir (si None, todos)
+            semilla: Semilla para reproducir el resultado (si None, aleatorio)
+            
+        Returns:
+            Resultado como cadena de bits (ver `EstadoCuantico.colapsar`)
+            
+        Raises:
+            ValueError: Si no existe el estado con el ID especificado
+        """
+        import random
+        
+        generador = random.Random(semilla) if semilla is not None else None
+        return self._requerir_estado(id).colapsar(qubits, generador)
+    
+    def valores_esperados(self, ids: Sequence[str], lista_observables: Sequence) -> Dict[str, Dict[str, complex]]:
+        """
+        Calcula los valores esperados de varios observables sobre varios estados en una sola llamada.
+        
+        Args:
+            ids: IDs de los estados a evaluar
+            lista_observables: Cadenas de Pauli u objetos OperadorCuantico
+            
+        Returns:
+            Diccionario {id_estado: {nombre_observable: valor_esperado}}
+            
+        Raises:
+            ValueError: Si no existe alguno de los estados o dos observables tienen el
+                mismo nombre (p. ej. la cadena "Z" y un OperadorCuantico llamado "Z")
+        """
+        nombres = [observables.nombre_observable(obs) for obs in lista_observables]
+        repetidos = sorted({nombre for nombre in nombres if nombres.count(nombre) > 1})
+        if repetidos:
+            raise ValueError(f"Observables con nombre repetido: {', '.join(repetidos)}")
+        vectores = [self._requerir_estado(id).vector for id in ids]
+        tabla = observables.tabla_valores_esperados(vectores, lista_observables)
+        return {id: dict(zip(nombres, fila)) for id, fila in zip(ids, tabla)}
+    
+    def fidelidades(self, id_referencia: str, ids: Optional[Sequence[str]] = None) -> Dict[str, float]:
+        """
+        Calcula la fidelidad de varios estados respecto a un estado de referencia.
+        
+        Args:
+            id_referencia: ID del estado de referencia
+            ids: IDs a comparar (si None, todos los de la misma dimensión)
+            
+        Returns:
+            Diccionario {id_estado: fidelidad}
+            
+        Raises:
+            ValueError: Si no existe alguno de los estados
+        """
+        referencia = self._requerir_estado(id_referencia)
+        if ids is None:
+            ids = [id for id, e in self.estados.items() if len(e.vector) == len(referencia.vector)]
+        return {id: referencia.fidelidad(self._requerir_estado(id)) for id in ids}
+    
+    def guardar(self, archivo: str, precision: str = "complex128", compresion: Optional[str] = "auto") -> None:
         """
         Guarda todos los estados en un archivo JSON.
         
+        El archivo contiene los estados y la tabla de contadores de IDs automáticos.
+        La codificación de cada vector se elige automáticamente según su tamaño y
+        dispersión (ver `codificacion.elegir_codificacion`): los vectores pequeños se
+        guardan como lista JSON y el resto en binario (denso o disperso, opcionalmente
+        comprimido) codificado en base64.
+        
         Args:
             archivo: Ruta del archivo donde guardar los datos
+            precision: "complex128" (sin pérdida) o "complex64" (reduce a la mitad las amplitudes)
+            compresion: "auto" (zlib para vectores grandes), None, "zlib" o "lzma"
         """
-        datos = [estado.to_dict() for estado in self.estados.values()]
+        import json
+        import codificacion
+        
+        datos = []
+        for estado in self.estados.values():
+            dato = estado.to_dict()
+            parametros = codificacion.elegir_codificacion(estado.vector, precision, compresion)
+            if parametros is not None:
+                dato["vector"] = codificacion.codificar_vector(estado.vector, **parametros)
+            padre, operador, _, _ = self._procedencia[estado.id]
+            if padre is not None:
+                dato["padre"] = padre
+                dato["operador"] = operador
+            datos.append(dato)
         
         # Convertir números complejos a un formato serializable
         def default_encoder(obj):
@@ -114,29 +600,130 @@ class RepositorioDeEstados:
             raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
         
         with open(archivo, 'w') as f:
-            json.dump(datos, f, default=default_encoder, indent=2)
+            json.dump({
+                "estados": datos,
+                "contadores": [[padre, operador, i] for (padre, operador), i in self._contadores.items()]
+            }, f, default=default_encoder, indent=2)
+    
+    def informe_almacenamiento(self, id: str) -> List[Dict]:
+        """
+        Compara tamaño, velocidad y error de cada codificación posible para un estado.
+        
+        Args:
+            id: ID del estado a analizar
+            
+        Returns:
+            Lista de mediciones (ver `codificacion.comparar_codificaciones`)
+            
+        Raises:
+            ValueError: Si no existe el estado con el ID especificado
+        """
+        import codificacion
+        
+        return codificacion.comparar_codificaciones(self._requerir_estado(id).vector)
     
-    def cargar(self, archivo: str) -> None:
+    def cargar(self, archivo: str) -> List[str]:
         """
         Carga estados desde un archivo JSON.
         
+        Acepta también el formato antiguo (una lista de estados sin contadores) y
+        decodifica de forma transparente los vectores guardados en binario.
+        Los estados que no se pueden cargar se omiten y se informa de ellos en el
+        valor devuelto (no se escribe nada por pantalla).
+        
         Args:
             archivo: Ruta del archivo desde donde cargar los datos
+            
+        Returns:
+            Lista con un mensaje por cada estado que no se pudo cargar
         """
+        import json
+        
         def object_hook(obj):
             if "__complex__" in obj:
                 return complex(obj["real"], obj["imag"])
+            if "__vector__" in obj:
+                import codificacion
+                return codificacion.decodificar_vector(obj)
             return obj
         
         with open(archivo, 'r') as f:
             datos = json.load(f, object_hook=object_hook)
         
+        contadores = []
+        if isinstance(datos, dict):
+            contadores = datos.get("contadores", [])
+            datos = datos["estados"]
+        
         # Limpiar el repositorio antes de cargar
         self.estados.clear()
+        self._limpiar_indices()
+        self._contadores = {(padre, operador): i for padre, operador, i in contadores}
         
+        ids = {dato.get("id") for dato in datos}
+        errores = []
         for dato in datos:
             try:
                 estado = EstadoCuantico.from_dict(dato)
-                self.estados[estado.id] = estado
+                if "padre" in dato:
+                    padre, operador = dato["padre"], dato["operador"]
+                else:
+                    # Archivos antiguos: deducir la procedencia del ID (ej. "q0_H_2")
+                    padre, operador = _procedencia_desde_id(estado.id, ids)
+                self._registrar(estado, padre, operador)
             except Exception as e:
-                print(f"Error al cargar estado {dato.get('id')}: {e}")
\ No newline at end of file
+                errores.append(f"Error al cargar estado {dato.get('id')}: {e}")
+        return errores
+
+def _validar_lote(ids: Sequence[str], vectores: Sequence[Sequence[complex]], max_errores: int = 10) -> List[str]:
+    """
+    Verifica en una sola pasada que todos los vectores del lote sean válidos.
+    
+    Returns:
+        Lista con la descripción de los primeros `max_errores` estados inválidos
+    """
+    errores = []
+    for id, vector in zip(ids, vectores):
+        if not len(vector):
+            errores.append(f"'{id}' tiene un vector vacío")
+        else:
+            suma_cuadrados = sum(a.real * a.real + a.imag * a.imag for a in map(complex, vector))
+            if not math.isclose(suma_cuadrados, 1.0, rel_tol=1e-5):
+                errores.append(f"'{id}' no está normalizado (suma de cuadrados = {suma_cuadrados})")
+        if len(errores) >= max_errores:
+            break
+    return errores
+
+def _validar_lote_numpy(ids: Sequence[str], amplitudes, max_errores: int = 10) -> List[str]:
+    """
+    Como `_validar_lote`, pero para una matriz de NumPy (una fila por estado),
+    calculando todas las normas con operaciones vectorizadas.
+    
+    Raises:
+        ValueError: Si `amplitudes` no es una matriz 2D
+    """
+    import numpy as np
+    
+    amplitudes = np.asarray(amplitudes)
+    if amplitudes.ndim != 2:
+        raise ValueError(f"Se esperaba una matriz 2D de amplitudes y se recibió una de {amplitudes.ndim} dimensiones")
+    if amplitudes.shape[1] == 0:
+        return [f"'{id}' tiene un vector vacío" for id in ids[:max_errores]]
+    sumas = np.sum(amplitudes.real ** 2 + amplitudes.imag ** 2, axis=1)
+    # Misma tolerancia que math.isclose(suma, 1.0, rel_tol=1e-5)
+    malos = np.flatnonzero(~(np.abs(sumas - 1.0) <= 1e-5 * np.maximum(sumas, 1.0)))
+    return [f"'{ids[i]}' no está normalizado (suma de cuadrados = {sumas[i]})" for i in malos[:max_errores]]
+
+def _procedencia_desde_id(id: str, ids: set) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Deduce (padre, operador) de un ID generado por `aplicar_operador`.
+    
+    Reconoce "<padre>_<operador>" y "<padre>_<operador>_<n>", donde <padre> debe ser
+    un ID existente. Devuelve (None, None) si el ID no tiene esa forma.
+    """
+    partes = id.split("_")
+    if len(partes) >= 3 and partes[-1].isdigit() and "_".join(partes[:-2]) in ids:
+        return "_".join(partes[:-2]), partes[-2]
+    if len(partes) >= 2 and "_".join(partes[:-1]) in ids:
+        return "_".join(partes[:-1]), partes[-1]
+    return None, None
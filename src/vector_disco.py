@@ -0,0 +1,273 @@
+"""
+Vectores de estado fuera de memoria, guardados en fragmentos de disco.
+
+Las 2^n amplitudes se reparten en 2^(n - c) archivos de 2^c amplitudes complex128
+(pares de float64 en el orden nativo de la máquina) que se leen mediante `mmap`.
+Sólo se mantienen en memoria los fragmentos que intervienen en cada paso, de modo
+que el tamaño máximo del estado lo limita el disco y no la RAM.
+"""
+
+from array import array
+from typing import Dict, List, Optional, Sequence
+import bisect
+import heapq
+import json
+import math
+import mmap
+import os
+import random
+from estado_cuantico import EstadoCuantico
+from observables import numero_qubits
+from operador_cuantico import OperadorCuantico, aplicar_matriz_local_en_sitio
+from backends import obtener_backend
+
+_METADATOS = "vector.json"
+_BYTES_AMPLITUD = 16
+
+class VectorEnDisco:
+    def __init__(self, directorio: str):
+        """
+        Abre un vector en disco ya existente (ver `crear` y `desde_estado`).
+
+        Args:
+            directorio: Directorio con los fragmentos y el archivo de metadatos
+        """
+        with open(os.path.join(directorio, _METADATOS), 'r') as f:
+            metadatos = json.load(f)
+        self.directorio = directorio
+        self.num_qubits: int = metadatos["num_qubits"]
+        self.qubits_por_fragmento: int = metadatos["qubits_por_fragmento"]
+        self.base: str = metadatos.get("base", "computacional")
+
+    @classmethod
+    def crear(cls, directorio: str, num_qubits: int, qubits_por_fragmento: int = 20,
+              base: str = "computacional") -> "VectorEnDisco":
+        """
+        Crea en disco el estado |0...0> de `num_qubits` qubits.
+
+        Los fragmentos se crean con `truncate`, así que en sistemas de archivos con
+        soporte para archivos dispersos no ocupan espacio hasta que se escriben.
+
+        Args:
+            directorio: Directorio donde guardar los fragmentos (se crea si no existe)
+            num_qubits: Número de qubits del estado
+            qubits_por_fragmento: Cada fragmento guarda 2^qubits_por_fragmento amplitudes
+            base: Base en la que está expresado el estado
+        """
+        if num_qubits < 1:
+            raise ValueError("El estado debe tener al menos un qubit")
+        qubits_por_fragmento = min(qubits_por_fragmento, num_qubits)
+        os.makedirs(directorio, exist_ok=True)
+        with open(os.path.join(directorio, _METADATOS), 'w') as f:
+            json.dump({"num_qubits": num_qubits, "qubits_por_fragmento": qubits_por_fragmento,
+                       "base": base}, f)
+
+        vector = cls(directorio)
+        tamano = (1 << qubits_por_fragmento) * _BYTES_AMPLITUD
+        for i in range(vector.num_fragmentos):
+            with open(vector._ruta(i), 'wb') as f:
+                f.truncate(tamano)
+        primero = [0j] * vector.tamano_fragmento
+        primero[0] = 1 + 0j
+        vector.escribir_fragmento(0, primero)
+        return vector
+
+    @classmethod
+    def desde_estado(cls, directorio: str, estado: EstadoCuantico, qubits_por_fragmento: int = 20) -> "VectorEnDisco":
+        """
+        Vuelca un EstadoCuantico en memoria a fragmentos en disco.
+        """
+        n = numero_qubits(len(estado.vector))
+        vector = cls.crear(directorio, n, qubits_por_fragmento, estado.base)
+        tamano = vector.tamano_fragmento
+        for i in range(vector.num_fragmentos):
+            vector.escribir_fragmento(i, estado.vector[i * tamano:(i + 1) * tamano])
+        return vector
+
+    @property
+    def num_fragmentos(self) -> int:
+        return 1 << (self.num_qubits - self.qubits_por_fragmento)
+
+    @property
+    def tamano_fragmento(self) -> int:
+        return 1 << self.qubits_por_fragmento
+
+    def _ruta(self, i: int) -> str:
+        return os.path.join(self.directorio, f"fragmento_{i:08d}.bin")
+
+    def leer_fragmento(self, i: int) -> List[complex]:
+        """Lee las amplitudes del fragmento i."""
+        datos = array('d')
+        with open(self._ruta(i), 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            # Copia directa de las páginas mapeadas al array, sin un bytes intermedio
+            with memoryview(m) as vista:
+                datos.frombytes(vista)
+        return [complex(re, im) for re, im in zip(datos[0::2], datos[1::2])]
+
+    def escribir_fragmento(self, i: int, amplitudes: Sequence[complex]) -> None:
+        """Sobrescribe las amplitudes del fragmento i."""
+        if len(amplitudes) != self.tamano_fragmento:
+            raise ValueError(f"El fragmento debe tener {self.tamano_fragmento} amplitudes")
+        datos = array('d', [0.0]) * (2 * len(amplitudes))
+        for j, a in enumerate(amplitudes):
+            a = complex(a)
+            datos[2 * j] = a.real
+            datos[2 * j + 1] = a.imag
+        with open(self._ruta(i), 'r+b') as f, mmap.mmap(f.fileno(), 0) as m:
+            m[:] = datos.tobytes()
+
+    def iterar_fragmentos(self):
+        """Genera (índice del fragmento, amplitudes) recorriendo el estado una vez."""
+        for i in range(self.num_fragmentos):
+            yield i, self.leer_fragmento(i)
+
+    def aplicar_operador(self, operador: OperadorCuantico, qubits: Sequence[int],
+                         backend: Optional[str] = None) -> None:
+        """
+        Aplica un operador sobre los qubits indicados, modificando el estado en disco.
+
+        Si todos los qubits destino son internos a un fragmento, cada fragmento se
+        procesa por separado. Si h de ellos seleccionan el fragmento, se procesan
+        grupos de 2^h fragmentos (pares de fragmentos para una puerta de un qubit).
+
+        Con backends vectoriales (NumPy, Numba) cada grupo se lee directamente del
+        disco a un array complex128 que se reutiliza entre grupos, y el núcleo del
+        backend lo modifica en el sitio; con el de Python se usan listas.
+
+        Args:
+            operador: Operador de k qubits
+            qubits: Qubits destino (0 = qubit más significativo)
+            backend: Backend de cálculo para cada grupo de fragmentos
+        """
+        n = self.num_qubits
+        c = self.qubits_por_fragmento
+        if len(operador.matriz) != 1 << len(qubits):
+            raise ValueError(f"Dimensiones incompatibles: operador {len(operador.matriz)}x{len(operador.matriz)} para {len(qubits)} qubit(s)")
+        if len(set(qubits)) != len(qubits) or any(not 0 <= q < n for q in qubits):
+            raise ValueError(f"Qubits no válidos {list(qubits)} para un estado de {n} qubits")
+
+        # Qubits que seleccionan el fragmento (bits altos del índice), de más a menos significativo
+        altos = sorted(q for q in qubits if n - 1 - q >= c)
+        h = len(altos)
+        # Posición de cada qubit destino dentro del vector concatenado del grupo
+        locales = [altos.index(q) if q in altos else h + (c - 1 - (n - 1 - q)) for q in qubits]
+        bits_grupo = [1 << (n - 1 - q - c) for q in altos]
+        mascara_grupo = sum(bits_grupo)
+        tamano = self.tamano_fragmento
+        motor = obtener_backend(backend)
+        if motor.vectorial:
+            import numpy as np
+            bufer = np.empty(tamano << h, dtype=np.complex128)
+
+        for base in range(self.num_fragmentos):
+            if base & mascara_grupo:
+                continue
+            indices = []
+            for s in range(1 << h):
+                indice = base
+                for t, bit in enumerate(bits_grupo):
+                    if s >> (h - 1 - t) & 1:
+                        indice |= bit
+                indices.append(indice)
+            if motor.vectorial:
+                for s, indice in enumerate(indices):
+                    with open(self._ruta(indice), 'rb') as f:
+                        f.readinto(bufer[s * tamano:(s + 1) * tamano])
+                aplicar_matriz_local_en_sitio(operador.matriz, bufer, locales, motor)
+                for s, indice in enumerate(indices):
+                    with open(self._ruta(indice), 'r+b') as f:
+                        f.write(bufer[s * tamano:(s + 1) * tamano])
+                continue
+            grupo = []
+            for indice in indices:
+                grupo.extend(self.leer_fragmento(indice))
+            aplicar_matriz_local_en_sitio(operador.matriz, grupo, locales, motor)
+            for s, indice in enumerate(indices):
+                self.escribir_fragmento(indice, grupo[s * tamano:(s + 1) * tamano])
+
+    def norma(self) -> float:
+        """Norma del vector, calculada en una pasada."""
+        return math.sqrt(math.fsum(abs(a)**2 for _, fragmento in self.iterar_fragmentos() for a in fragmento))
+
+    def medir(self, qubits: Sequence[int]) -> Dict[str, float]:
+        """
+        Distribución marginal de los qubits indicados, calculada en una sola pasada por el disco.
+
+        No hay versión sin `qubits`: el resultado tendría 2^n entradas en memoria,
+        justo lo que este tipo de vector evita (ver `mas_probables`).
+
+        Args:
+            qubits: Qubits a medir (el resultado tiene como mucho 2^len(qubits) entradas)
+
+        Returns:
+            Diccionario {resultado: probabilidad}, con claves de bits en el orden
+            indicado (ej. "01")
+        """
+        n = self.num_qubits
+        if not qubits or len(set(qubits)) != len(qubits) or any(not 0 <= q < n for q in qubits):
+            raise ValueError(f"Qubits no válidos {list(qubits)} para un estado de {n} qubits")
+        posiciones = [n - 1 - q for q in qubits]
+        mascara = sum(1 << pos for pos in posiciones)
+        acumuladas: Dict[int, float] = {}
+        for i, fragmento in self.iterar_fragmentos():
+            desplazamiento = i * self.tamano_fragmento
+            for j, a in enumerate(fragmento):
+                if a:
+                    clave = (desplazamiento + j) & mascara
+                    acumuladas[clave] = acumuladas.get(clave, 0.0) + abs(a)**2
+        return {"".join("1" if clave >> pos & 1 else "0" for pos in posiciones): prob
+                for clave, prob in acumuladas.items()}
+
+    def mas_probables(self, k: int = 10) -> Dict[str, float]:
+        """
+        Los k resultados de mayor probabilidad, en una pasada y con memoria O(k).
+
+        Returns:
+            Diccionario {índice del estado base: probabilidad}, de mayor a menor
+            probabilidad, con las mismas claves que `EstadoCuantico.medir`
+        """
+        mejores = heapq.nlargest(k, ((abs(a)**2, i * self.tamano_fragmento + j)
+                                     for i, fragmento in self.iterar_fragmentos()
+                                     for j, a in enumerate(fragmento) if a))
+        return {str(indice): prob for prob, indice in mejores}
+
+    def muestrear(self, disparos: int, semilla: Optional[int] = None) -> Dict[str, int]:
+        """
+        Simula `disparos` mediciones de todos los qubits en una sola pasada por el disco.
+
+        Se generan y ordenan primero los números aleatorios; después se recorre la
+        distribución acumulada fragmento a fragmento asignando cada uno a su resultado.
+
+        Returns:
+            Diccionario {índice del estado base: número de veces observado}
+        """
+        generador = random.Random(semilla)
+        umbrales = sorted(generador.random() for _ in range(disparos))
+        cuentas: Dict[str, int] = {}
+        acumulada = 0.0
+        siguiente = 0
+        ultimo = None
+        for i, fragmento in self.iterar_fragmentos():
+            desplazamiento = i * self.tamano_fragmento
+            for j, a in enumerate(fragmento):
+                if not a:
+                    continue
+                acumulada += abs(a)**2
+                ultimo = str(desplazamiento + j)
+                fin = bisect.bisect_left(umbrales, acumulada, siguiente)
+                if fin > siguiente:
+                    cuentas[ultimo] = cuentas.get(ultimo, 0) + fin - siguiente
+                    siguiente = fin
+        if siguiente < disparos and ultimo is not None:
+            # Umbrales por encima de la suma acumulada por redondeo
+            cuentas[ultimo] = cuentas.get(ultimo, 0) + disparos - siguiente
+        return cuentas
+
+    def a_estado(self, id: str) -> EstadoCuantico:
+        """Carga el vector completo en memoria como EstadoCuantico (sólo para estados pequeños)."""
+        vector = [a for _, fragmento in self.iterar_fragmentos() for a in fragmento]
+        return EstadoCuantico(id, vector, self.base)
+
+    def __str__(self) -> str:
+        return (f"Vector en disco {self.directorio}: {self.num_qubits} qubits en "
+                f"{self.num_fragmentos} fragmentos de {self.tamano_fragmento} amplitudes, base {self.base}")
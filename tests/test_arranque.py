@@ -0,0 +1,44 @@
+import unittest
+import json
+import os
+import subprocess
+import sys
+
+DIRECTORIO_SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Presupuesto de tiempo para importar el punto de entrada (sin contar el arranque del intérprete)
+PRESUPUESTO_IMPORTACION_S = 0.25
+
+# Módulos que sólo deben cargarse cuando se usan (códecs de serialización, backends numéricos, etc.)
+MODULOS_PEREZOSOS = ["argparse", "csv", "json", "numpy", "numba", "concurrent.futures",
+                     "matriz_densidad", "canales_ruido", "ejecutor_script", "codificacion"]
+
+MEDICION = """
+import sys, time
+inicio = time.perf_counter()
+import main
+duracion = time.perf_counter() - inicio
+modulos = sorted(sys.modules)
+import json
+print(json.dumps({"duracion": duracion, "modulos": modulos}))
+"""
+
+class TestArranque(unittest.TestCase):
+    def medir_importacion(self):
+        salida = subprocess.run([sys.executable, "-c", MEDICION], cwd=DIRECTORIO_SRC,
+                                capture_output=True, text=True, check=True).stdout
+        return json.loads(salida)
+    
+    def test_importaciones_perezosas(self):
+        modulos = self.medir_importacion()["modulos"]
+        for modulo in MODULOS_PEREZOSOS:
+            self.assertNotIn(modulo, modulos)
+    
+    def test_presupuesto_de_importacion(self):
+        # La primera ejecución puede incluir la compilación a bytecode
+        self.medir_importacion()
+        duracion = min(self.medir_importacion()["duracion"] for _ in range(3))
+        self.assertLess(duracion, PRESUPUESTO_IMPORTACION_S)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import math
+import random
+from src.estado_cuantico import EstadoCuantico
+from src.operador_cuantico import crear_operador_h
+import backends  # Sin "src.": es el registro que importan (en plano) los módulos de src
+
+def vector_aleatorio(generador, dimension):
+    vector = [complex(generador.gauss(0, 1), generador.gauss(0, 1)) for _ in range(dimension)]
+    norma = math.sqrt(sum(abs(a)**2 for a in vector))
+    return [a / norma for a in vector]
+
+def matriz_aleatoria(generador, dimension):
+    return [[complex(generador.gauss(0, 1), generador.gauss(0, 1)) for _ in range(dimension)]
+            for _ in range(dimension)]
+
+class TestConformidadBackends(unittest.TestCase):
+    """Cada backend disponible debe coincidir con la implementación de referencia en Python."""
+    
+    def setUp(self):
+        self.referencia = backends.BackendPython()
+        self.generador = random.Random(1234)
+    
+    def assertVectoresIguales(self, a, b):
+        self.assertEqual(len(a), len(b))
+        for x, y in zip(a, b):
+            self.assertAlmostEqual(complex(x), complex(y), places=10)
+    
+    def test_aplicar_matriz_local(self):
+        for nombre in backends.backends_disponibles():
+            backend = backends.obtener_backend(nombre)
+            with self.subTest(backend=nombre):
+                for n, qubits in [(1, [0]), (3, [1]), (3, [2, 0]), (4, [0, 3, 1]), (5, [4])]:
+                    vector = vector_aleatorio(self.generador, 1 << n)
+                    matriz = matriz_aleatoria(self.generador, 1 << len(qubits))
+                    self.assertVectoresIguales(backend.aplicar_matriz_local(matriz, vector, qubits, n),
+                                               self.referencia.aplicar_matriz_local(matriz, vector, qubits, n))
+    
+    def test_aplicar_matriz_local_en_sitio(self):
+        for nombre in backends.backends_disponibles():
+            backend = backends.obtener_backend(nombre)
+            with self.subTest(backend=nombre):
+                for n, qubits in [(1, [0]), (3, [1]), (3, [2, 0]), (4, [0, 3, 1])]:
+                    vector = vector_aleatorio(self.generador, 1 << n)
+                    matriz = matriz_aleatoria(self.generador, 1 << len(qubits))
+                    esperado = self.referencia.aplicar_matriz_local(matriz, vector, qubits, n)
+                    backend.aplicar_matriz_local_en_sitio(matriz, vector, qubits, n)
+                    self.assertVectoresIguales(vector, esperado)
+    
+    def test_aplicar_matriz_local_en_sitio_numpy(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy no está instalado")
+        for nombre in ("numpy", "numba"):
+            if nombre not in backends.backends_disponibles():
+                continue
+            backend = backends.obtener_backend(nombre)
+            with self.subTest(backend=nombre):
+                lista = vector_aleatorio(self.generador, 16)
+                matriz = matriz_aleatoria(self.generador, 4)
+                vector = np.array(lista)
+                backend.aplicar_matriz_local_en_sitio(matriz, vector, [3, 1], 4)
+                self.assertVectoresIguales(vector.tolist(),
+                                           self.referencia.aplicar_matriz_local(matriz, lista, [3, 1], 4))
+                if nombre == "numba":
+                    # El núcleo JIT trabaja sobre el propio array, sin el búfer de einsum
+                    self.assertEqual(backend._auxiliares, {})
+    
+    def test_aplicar_matriz(self):
+        for nombre in backends.backends_disponibles():
+            backend = backends.obtener_backend(nombre)
+            with self.subTest(backend=nombre):
+                for dimension in (2, 3, 8):
+                    vector = vector_aleatorio(self.generador, dimension)
+                    matriz = matriz_aleatoria(self.generador, dimension)
+                    self.assertVectoresIguales(backend.aplicar_matriz(matriz, vector),
+                                               self.referencia.aplicar_matriz(matriz, vector))
+    
+    def test_probabilidades(self):
+        vector = vector_aleatorio(self.generador, 16)
+        for nombre in backends.backends_disponibles():
+            with self.subTest(backend=nombre):
+                probs = backends.obtener_backend(nombre).probabilidades(vector)
+                for p, q in zip(probs, self.referencia.probabilidades(vector)):
+                    self.assertAlmostEqual(p, q)
+
+class TestRegistroBackends(unittest.TestCase):
+    def tearDown(self):
+        backends.establecer_backend("python")
+    
+    def test_python_siempre_disponible(self):
+        self.assertIn("python", backends.backends_disponibles())
+        self.assertEqual(backends.backend_actual(), "python")
+    
+    def test_seleccion_global_y_por_llamada(self):
+        estado = EstadoCuantico("q0", [1, 0])
+        op_h = crear_operador_h()
+        for nombre in backends.backends_disponibles():
+            backends.establecer_backend(nombre)
+            self.assertEqual(backends.backend_actual(), nombre)
+            self.assertAlmostEqual(op_h.aplicar(estado).medir()["1"], 0.5)
+            self.assertAlmostEqual(op_h.aplicar(estado, backend="python").medir(backend=nombre)["0"], 0.5)
+        
+        backends.establecer_backend("auto")
+        self.assertIn(backends.backend_actual(), backends.backends_disponibles())
+    
+    def test_backend_desconocido(self):
+        with self.assertRaises(ValueError):
+            backends.establecer_backend("no_existe")
+        with self.assertRaises(ValueError):
+            crear_operador_h().aplicar(EstadoCuantico("q0", [1, 0]), backend="no_existe")
+    
+    def test_registrar_backend(self):
+        class BackendNoDisponible(backends.BackendPython):
+            nombre = "falso"
+            
+            @staticmethod
+            def disponible():
+                return False
+        
+        backends.registrar_backend("falso", BackendNoDisponible)
+        try:
+            self.assertNotIn("falso", backends.backends_disponibles())
+            with self.assertRaises(ValueError):
+                backends.establecer_backend("falso")
+        finally:
+            del backends._REGISTRO["falso"]
+
+if __name__ == "__main__":
+    unittest.main()
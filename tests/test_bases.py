@@ -0,0 +1,78 @@
+import unittest
+import random
+from src.bases import (bases_por_qubit, nombre_base, cambiar_base, transformada_hadamard,
+                       probabilidades_en_base)
+from src.backends import backends_disponibles
+from src.operador_cuantico import crear_operador_h, aplicar_matriz_local
+
+class TestBases(unittest.TestCase):
+    def setUp(self):
+        generador = random.Random(0)
+        vector = [complex(generador.gauss(0, 1), generador.gauss(0, 1)) for _ in range(16)]
+        norma = sum(abs(a)**2 for a in vector) ** 0.5
+        self.vector = [a / norma for a in vector]
+    
+    def assertVectoresIguales(self, a, b):
+        for x, y in zip(a, b):
+            self.assertAlmostEqual(abs(x - y), 0.0, places=12)
+    
+    def test_nombres(self):
+        self.assertEqual(bases_por_qubit("computacional", 3), "ZZZ")
+        self.assertEqual(bases_por_qubit("Hadamard", 2), "XX")
+        self.assertEqual(bases_por_qubit("zxy", 3), "ZXY")
+        self.assertEqual(nombre_base("YY"), "circular")
+        self.assertEqual(nombre_base("ZX"), "ZX")
+        with self.assertRaises(ValueError):
+            bases_por_qubit("ZX", 3)
+        with self.assertRaises(ValueError):
+            bases_por_qubit("polar", 1)
+    
+    def test_estados_de_un_qubit(self):
+        h = 1/2**0.5
+        casos = [([1, 0], "hadamard", [h, h]), ([h, -h], "hadamard", [0, 1]),
+                 ([h, 1j*h], "circular", [1, 0]), ([h, -1j*h], "circular", [0, 1])]
+        for vector, base, esperado in casos:
+            vector = list(vector)
+            self.assertEqual(cambiar_base(vector, "computacional", base), base)
+            self.assertVectoresIguales(vector, esperado)
+    
+    def test_hadamard_coincide_con_puertas(self):
+        esperado = list(self.vector)
+        for q in (0, 2):
+            esperado = aplicar_matriz_local(crear_operador_h().matriz, esperado, [q])
+        vector = list(self.vector)
+        transformada_hadamard(vector, [0, 2])
+        self.assertVectoresIguales(vector, esperado)
+        
+        vector = list(self.vector)
+        cambiar_base(vector, "ZZZZ", "XZXZ")
+        self.assertVectoresIguales(vector, esperado)
+    
+    def test_ida_y_vuelta_bases_mixtas(self):
+        for origen, destino in (("computacional", "YXZY"), ("XYYZ", "circular"), ("hadamard", "ZYXX")):
+            vector = list(self.vector)
+            self.assertEqual(cambiar_base(vector, origen, destino), nombre_base(bases_por_qubit(destino, 4)))
+            self.assertAlmostEqual(sum(abs(a)**2 for a in vector), 1.0)
+            cambiar_base(vector, destino, origen)
+            self.assertVectoresIguales(vector, self.vector)
+    
+    def test_probabilidades_sin_modificar(self):
+        original = list(self.vector)
+        probs = probabilidades_en_base(self.vector, "computacional", "hadamard")
+        self.assertEqual(self.vector, original)
+        transformado = list(self.vector)
+        cambiar_base(transformado, "computacional", "hadamard")
+        for p, a in zip(probs, transformado):
+            self.assertAlmostEqual(p, abs(a)**2)
+
+    def test_probabilidades_en_cada_backend(self):
+        transformado = list(self.vector)
+        cambiar_base(transformado, "YZXY", "XYZZ")
+        for nombre in backends_disponibles():
+            with self.subTest(backend=nombre):
+                probs = probabilidades_en_base(self.vector, "YZXY", "XYZZ", backend=nombre)
+                for p, a in zip(probs, transformado):
+                    self.assertAlmostEqual(p, abs(a)**2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from src.canales_ruido import (CanalCuantico, crear_canal_bit_flip, crear_canal_phase_flip,
+                               crear_canal_despolarizante, crear_canal_amortiguamiento,
+                               simular_trayectorias)
+from src.matriz_densidad import MatrizDensidad
+from src.estado_cuantico import EstadoCuantico
+from src.operador_cuantico import OperadorCuantico, crear_operador_h
+
+class TestCanalesRuido(unittest.TestCase):
+    def test_kraus_no_completos(self):
+        with self.assertRaises(ValueError):
+            CanalCuantico("malo", [OperadorCuantico("K", [[1, 0], [0, 0.5]])])
+        with self.assertRaises(ValueError):
+            crear_canal_bit_flip(1.5)
+    
+    def test_canales_exactos(self):
+        rho0 = MatrizDensidad.desde_estado(EstadoCuantico("q0", [1, 0]))
+        rho1 = MatrizDensidad.desde_estado(EstadoCuantico("q1", [0, 1]))
+        h = 1/2**0.5
+        rho_plus = MatrizDensidad.desde_estado(EstadoCuantico("q+", [h, h]))
+        
+        self.assertAlmostEqual(crear_canal_bit_flip(0.2).aplicar_densidad(rho0).medir()["1"], 0.2)
+        self.assertAlmostEqual(crear_canal_amortiguamiento(0.3).aplicar_densidad(rho1).medir()["0"], 0.3)
+        # Phase-flip sólo reduce las coherencias: (1 - 2p)/2
+        self.assertAlmostEqual(crear_canal_phase_flip(0.1).aplicar_densidad(rho_plus).matriz[0][1], 0.4)
+        # Despolarizante total: estado máximamente mixto
+        self.assertAlmostEqual(crear_canal_despolarizante(1.0).aplicar_densidad(rho0).pureza(), 0.5)
+    
+    def test_canal_sobre_un_qubit(self):
+        rho = MatrizDensidad.desde_estado(EstadoCuantico("q00", [1, 0, 0, 0]))
+        resultado = crear_canal_bit_flip(0.25).aplicar_densidad(rho, qubits=[1])
+        probs = resultado.medir()
+        self.assertAlmostEqual(probs["0"], 0.75)
+        self.assertAlmostEqual(probs["1"], 0.25)
+        self.assertAlmostEqual(probs["2"], 0.0)
+    
+    def test_densidad_diez_qubits(self):
+        import importlib.util
+        n = 10
+        vector = [0j] * (1 << n)
+        vector[0] = vector[-1] = 1 / 2**0.5
+        rho = MatrizDensidad.desde_estado(EstadoCuantico("ghz", vector))
+        backend = "numpy" if importlib.util.find_spec("numpy") else "python"
+        
+        resultado = crear_canal_despolarizante(0.2).aplicar_densidad(rho, qubits=[3], backend=backend)
+        resultado = crear_operador_h().aplicar_densidad(resultado, qubits=[0], backend=backend)
+        self.assertAlmostEqual(sum(resultado.medir().values()), 1.0)
+        # Los operadores locales conmutan con la traza parcial del resto de qubits
+        referencia = crear_canal_despolarizante(0.2).aplicar_densidad(rho.traza_parcial([0, 3]), qubits=[1], backend="python")
+        referencia = crear_operador_h().aplicar_densidad(referencia, qubits=[0], backend="python")
+        reducida = resultado.traza_parcial([0, 3])
+        for fila, fila_ref in zip(reducida.matriz, referencia.matriz):
+            for c, c_ref in zip(fila, fila_ref):
+                self.assertAlmostEqual(c, c_ref)
+    
+    def test_trayectorias_convergen_a_densidad(self):
+        estado = EstadoCuantico("q0", [1, 0])
+        pasos = [(crear_operador_h(), None), (crear_canal_amortiguamiento(0.4), [0])]
+        exacto = MatrizDensidad.desde_estado(estado)
+        exacto = crear_operador_h().aplicar_densidad(exacto)
+        exacto = crear_canal_amortiguamiento(0.4).aplicar_densidad(exacto).medir()
+        
+        resultado = simular_trayectorias(estado, pasos, 2000, semilla=7)
+        for clave in exacto:
+            self.assertLess(abs(resultado["probabilidades"][clave] - exacto[clave]),
+                            5 * resultado["error_estandar"][clave] + 1e-9)
+    
+    def test_trayectorias_reproducibles(self):
+        estado = EstadoCuantico("q0", [1, 0])
+        pasos = [(crear_canal_bit_flip(0.3), None)]
+        a = simular_trayectorias(estado, pasos, 200, semilla=3)
+        b = simular_trayectorias(estado, pasos, 200, semilla=3, procesos=2)
+        self.assertEqual(a, b)
+        c = simular_trayectorias(estado, pasos, 200, semilla=4)
+        self.assertNotEqual(a, c)
+
+if __name__ == "__main__":
+    unittest.main()
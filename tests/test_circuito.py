@@ -0,0 +1,43 @@
+import unittest
+import random
+from src.circuito import Circuito
+from src.estado_cuantico import EstadoCuantico
+from src.operador_cuantico import OperadorCuantico, crear_operador_x, crear_operador_h
+
+class TestCircuito(unittest.TestCase):
+    def setUp(self):
+        self.cnot = OperadorCuantico("CNOT", [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+    
+    def test_medicion_correlacionada(self):
+        h = 1/2**0.5
+        bell = EstadoCuantico("bell", [h, 0, 0, h])
+        cuentas = Circuito().medir([0], "a").medir([1], "b").ejecutar(bell, disparos=500, semilla=1)
+        self.assertEqual(set(cuentas), {"0 0", "1 1"})
+        self.assertEqual(sum(cuentas.values()), 500)
+        self.assertGreater(cuentas["0 0"], 150)
+        # El estado original no se modifica
+        self.assertEqual(bell.vector, [h, 0, 0, h])
+    
+    def test_puerta_condicionada(self):
+        # Medir |+> y corregir con X si sale 1: el qubit termina siempre en |0>
+        circuito = (Circuito("reset")
+                    .puerta(crear_operador_h(), [0])
+                    .medir([0], "m")
+                    .puerta(crear_operador_x(), [0], condicion=("m", "1"))
+                    .medir([0], "z"))
+        cuentas = circuito.ejecutar(EstadoCuantico("q0", [1, 0]), disparos=200, semilla=3)
+        self.assertEqual(set(cuentas), {"0 0", "1 0"})
+    
+    def test_reproducible(self):
+        circuito = Circuito().puerta(crear_operador_h(), [0]).puerta(self.cnot).medir([0, 1], "m")
+        estado = EstadoCuantico("q00", [1, 0, 0, 0])
+        self.assertEqual(circuito.ejecutar(estado, 100, semilla=5), circuito.ejecutar(estado, 100, semilla=5))
+    
+    def test_ejecutar_disparo_en_sitio(self):
+        estado = EstadoCuantico("q0", [1, 0])
+        registro = Circuito().puerta(crear_operador_x(), [0]).medir([0], "m").ejecutar_disparo(estado, random.Random(0))
+        self.assertEqual(registro, {"m": "1"})
+        self.assertAlmostEqual(estado.vector[1], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+import json
+from src.codificacion import (codificar_vector, decodificar_vector, elegir_codificacion,
+                              comparar_codificaciones)
+
+class TestCodificacion(unittest.TestCase):
+    def setUp(self):
+        self.denso = [complex(i % 7, -(i % 3)) / 10 for i in range(64)]
+        self.disperso = [0j] * 1024
+        self.disperso[5] = 0.6
+        self.disperso[1000] = 0.8j
+    
+    def test_ida_y_vuelta(self):
+        for formato in ("denso", "disperso"):
+            for compresion in (None, "zlib", "lzma"):
+                codificado = codificar_vector(self.denso, formato, "complex128", compresion)
+                json.dumps(codificado)  # Debe ser serializable
+                self.assertEqual(decodificar_vector(codificado), self.denso)
+    
+    def test_complex64(self):
+        codificado = codificar_vector(self.denso, precision="complex64")
+        for a, b in zip(decodificar_vector(codificado), self.denso):
+            self.assertAlmostEqual(a, b, places=6)
+        self.assertLess(len(codificado["datos"]),
+                        len(codificar_vector(self.denso)["datos"]))
+    
+    def test_eleccion_automatica(self):
+        self.assertIsNone(elegir_codificacion([1, 0]))
+        self.assertEqual(elegir_codificacion(self.disperso)["formato"], "disperso")
+        self.assertIsNone(elegir_codificacion(self.disperso)["compresion"])
+        grande = [1 / 2**7] * (1 << 14)
+        self.assertEqual(elegir_codificacion(grande), {"formato": "denso", "precision": "complex128", "compresion": "zlib"})
+        self.assertEqual(elegir_codificacion([1, 0], "complex64")["precision"], "complex64")
+    
+    def test_informe(self):
+        informe = comparar_codificaciones(self.disperso, repeticiones=1)
+        self.assertEqual(informe[0]["formato"], "json")
+        self.assertEqual(len(informe), 13)
+        por_formato = {(f["formato"], f["precision"], f["compresion"]): f for f in informe}
+        self.assertLess(por_formato[("disperso", "complex128", None)]["bytes"], informe[0]["bytes"] / 100)
+        self.assertEqual(por_formato[("denso", "complex128", "zlib")]["error_maximo"], 0.0)
+
+if __name__ == "__main__":
+    unittest.main()
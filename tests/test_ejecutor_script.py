@@ -0,0 +1,85 @@
+import unittest
+import io
+import json
+import os
+import tempfile
+from src.ejecutor_script import EjecutorScript, ejecutar_script
+
+class TestEjecutorScript(unittest.TestCase):
+    def test_ejecutar_operaciones(self):
+        script = [
+            '{"op": "agregar", "id": "q0", "vector": [1, 0]}',
+            '# comentario',
+            '{"op": "agregar", "id": "q1", "vector": ["0.6", [0, 0.8]]}',
+            '{"op": "aplicar", "id": "q0", "operador": "x"}',
+            '{"op": "medir", "id": "q0_X"}',
+            '{"op": "medir", "id": "q0", "base": "hadamard"}',
+            '{"op": "cambiar_base", "id": "q0", "base": "x"}',
+        ]
+        ejecutor = EjecutorScript()
+        resultados = list(ejecutor.ejecutar(script))
+        self.assertEqual([r["linea"] for r in resultados], [1, 3, 4, 5, 6, 7])
+        self.assertTrue(all(r["ok"] for r in resultados))
+        self.assertEqual(resultados[2]["id"], "q0_X")
+        self.assertAlmostEqual(resultados[3]["probabilidades"]["1"], 1.0)
+        self.assertEqual(ejecutor.repo.obtener_estado("q1").vector, [0.6, 0.8j])
+        self.assertAlmostEqual(resultados[4]["probabilidades"]["1"], 0.5)
+        self.assertEqual(resultados[5]["base"], "hadamard")
+    
+    def test_errores_por_linea(self):
+        script = [
+            '{"op": "agregar", "id": "q0", "vector": [1, 0]}',
+            '{"op": "agregar", "id": "malo", "vector": [1, 1]}',
+            '{"op": "agregar", "id": "q1", "vector": [0, 1]}',
+            'esto no es json',
+            '{"op": "aplicar", "id": "q0", "operador": "T"}',
+            '{"op": "medir"}',
+            '{"op": "desconocida"}',
+        ]
+        ejecutor = EjecutorScript()
+        resultados = list(ejecutor.ejecutar(script))
+        self.assertEqual([r["ok"] for r in resultados], [True, False, True, False, False, False, False])
+        self.assertEqual(ejecutor.errores, 5)
+        self.assertEqual(sorted(ejecutor.repo.estados), ["q0", "q1"])
+    
+    def test_ids_numericos(self):
+        # El mismo ID numérico se guarda como cadena tanto si el lote falla como si no
+        for script in (['{"op": "agregar", "id": 5, "vector": [1, 0]}'],
+                       ['{"op": "agregar", "id": 5, "vector": [1, 0]}',
+                        '{"op": "agregar", "id": 6, "vector": [1, 1]}']):
+            ejecutor = EjecutorScript()
+            list(ejecutor.ejecutar(script + ['{"op": "medir", "id": 5}']))
+            self.assertEqual(list(ejecutor.repo.estados), ["5"])
+            self.assertEqual(ejecutor.errores, len(script) - 1)
+    
+    def test_errores_de_carga(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            archivo = os.path.join(tmpdir, "estados.json")
+            with open(archivo, "w") as f:
+                json.dump([{"id": "bad", "vector": [1, 1], "base": "computacional"},
+                           {"id": "q0", "vector": [1, 0], "base": "computacional"}], f)
+            salida = io.StringIO()
+            script = io.StringIO(json.dumps({"op": "cargar", "archivo": archivo}))
+            self.assertEqual(ejecutar_script(script, salida), 1)
+            lineas = [json.loads(l) for l in salida.getvalue().splitlines()]
+            self.assertEqual(len(lineas), 1)
+            self.assertFalse(lineas[0]["ok"])
+            self.assertEqual(lineas[0]["estados"], 1)
+            self.assertIn("bad", lineas[0]["errores"][0])
+    
+    def test_salida_json_lines_y_persistencia(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            archivo = os.path.join(tmpdir, "estados.json")
+            script = io.StringIO("\n".join([
+                '{"op": "agregar", "id": "q0", "vector": [1, 0]}',
+                json.dumps({"op": "guardar", "archivo": archivo}),
+                json.dumps({"op": "cargar", "archivo": archivo}),
+            ]))
+            salida = io.StringIO()
+            self.assertEqual(ejecutar_script(script, salida), 0)
+            lineas = [json.loads(l) for l in salida.getvalue().splitlines()]
+            self.assertEqual(len(lineas), 3)
+            self.assertEqual(lineas[2]["estados"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,11 +31,107 @@ class TestEstadoCuantico(unittest.TestCase):
             
         EstadoCuantico("q_ok", [0.6, 0.8])  # 0.6² + 0.8² = 1
     
+    def test_cambio_de_base(self):
+        h = 1/2**0.5
+        estado = EstadoCuantico("q+", [h, h])
+        self.assertAlmostEqual(estado.medir(base="hadamard")["0"], 1.0)
+        self.assertEqual(estado.vector, [h, h])
+        self.assertEqual(estado.base, "computacional")
+        
+        estado.cambiar_base("x")
+        self.assertEqual(estado.base, "hadamard")
+        self.assertAlmostEqual(estado.vector[0], 1.0)
+        self.assertAlmostEqual(estado.medir(base="computacional")["1"], 0.5)
+        
+        # El backend indicado se usa también al medir en otra base
+        from src.backends import BackendPython
+        class Espia(BackendPython):
+            llamadas = 0
+            def probabilidades(self, vector):
+                Espia.llamadas += 1
+                return super().probabilidades(vector)
+        probs = estado.medir(backend=Espia(), base="circular")
+        self.assertEqual(Espia.llamadas, 1)
+        self.assertAlmostEqual(probs["0"], 0.5)
+        
+        bell = EstadoCuantico("bell", [h, 0, 0, h])
+        bell.cambiar_base("XZ")
+        self.assertEqual(bell.base, "XZ")
+        with self.assertRaises(ValueError):
+            EstadoCuantico("q", [1, 0], "polar").cambiar_base("hadamard")
+    
     def test_str_repr(self):
         estado = EstadoCuantico("q0", [1, 0])
         self.assertIn("q0", str(estado))
         self.assertIn("vector", str(estado))
         self.assertIn("EstadoCuantico", repr(estado))
 
+    def test_valor_esperado_pauli(self):
+        h = 1/2**0.5
+        self.assertAlmostEqual(EstadoCuantico("q0", [1, 0]).valor_esperado("Z"), 1.0)
+        self.assertAlmostEqual(EstadoCuantico("q1", [0, 1]).valor_esperado("Z"), -1.0)
+        self.assertAlmostEqual(EstadoCuantico("q+", [h, h]).valor_esperado("X"), 1.0)
+        self.assertAlmostEqual(EstadoCuantico("q+i", [h, 1j*h]).valor_esperado("Y"), 1.0)
+        
+        # Estado de Bell (|00> + |11>)/sqrt(2)
+        bell = EstadoCuantico("bell", [h, 0, 0, h])
+        self.assertAlmostEqual(bell.valor_esperado("ZZ"), 1.0)
+        self.assertAlmostEqual(bell.valor_esperado("XX"), 1.0)
+        self.assertAlmostEqual(bell.valor_esperado("YY"), -1.0)
+        self.assertAlmostEqual(bell.valor_esperado("ZI"), 0.0)
+        
+        # |01>: el primer carácter actúa sobre el qubit más significativo
+        estado01 = EstadoCuantico("q01", [0, 1, 0, 0])
+        self.assertAlmostEqual(estado01.valor_esperado("ZI"), 1.0)
+        self.assertAlmostEqual(estado01.valor_esperado("IZ"), -1.0)
+        
+        with self.assertRaises(ValueError):
+            bell.valor_esperado("Z")
+        with self.assertRaises(ValueError):
+            bell.valor_esperado("ZA")
+    
+    def test_producto_interno_y_fidelidad(self):
+        h = 1/2**0.5
+        estado0 = EstadoCuantico("q0", [1, 0])
+        estado_plus = EstadoCuantico("q+", [h, h])
+        estado_i = EstadoCuantico("qi", [0, 1j])
+        self.assertAlmostEqual(estado0.producto_interno(estado_plus), h)
+        self.assertAlmostEqual(estado_i.producto_interno(estado_i), 1)
+        self.assertAlmostEqual(estado_plus.producto_interno(estado_i), 1j*h)
+        self.assertAlmostEqual(estado0.fidelidad(estado_plus), 0.5)
+
+    def test_resumen_truncado(self):
+        vector = [0] * 1024
+        vector[0] = 1
+        resumen = EstadoCuantico("grande", vector).resumen(k=2)
+        self.assertIn("dim=1024", resumen)
+        self.assertIn("norma=1.000000", resumen)
+        self.assertIn("...", resumen)
+        self.assertEqual(resumen.count("j"), 4)
+        
+        self.assertNotIn("...", EstadoCuantico("q0", [1, 0]).resumen())
+
+    def test_colapsar(self):
+        import random
+        h = 1/2**0.5
+        estado = EstadoCuantico("bell", [h, 0, 0, h])
+        vector = estado.vector
+        resultado = estado.colapsar([1], random.Random(0))
+        self.assertIn(resultado, ("0", "1"))
+        self.assertIs(estado.vector, vector)  # Actualizado en el sitio
+        indice = 0 if resultado == "0" else 3
+        self.assertAlmostEqual(estado.vector[indice], 1)
+        self.assertAlmostEqual(sum(abs(a)**2 for a in estado.vector), 1)
+        # El otro qubit queda correlacionado
+        self.assertEqual(estado.colapsar([0]), resultado)
+        
+        # Varios qubits: |011> da "011" en ese orden y "110" en orden inverso
+        estado = EstadoCuantico("q011", [0, 0, 0, 1, 0, 0, 0, 0])
+        self.assertEqual(estado.colapsar(), "011")
+        self.assertEqual(estado.colapsar([2, 1, 0]), "110")
+        
+        with self.assertRaises(ValueError):
+            estado.colapsar([3])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
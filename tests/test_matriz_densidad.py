@@ -0,0 +1,71 @@
+import unittest
+from src.matriz_densidad import MatrizDensidad
+from src.estado_cuantico import EstadoCuantico
+from src.operador_cuantico import OperadorCuantico, crear_operador_x, crear_operador_h
+
+class TestMatrizDensidad(unittest.TestCase):
+    def setUp(self):
+        h = 1/2**0.5
+        self.bell = EstadoCuantico("bell", [h, 0, 0, h])
+        self.cnot = OperadorCuantico("CNOT", [
+            [1, 0, 0, 0],
+            [0, 1, 0, 0],
+            [0, 0, 0, 1],
+            [0, 0, 1, 0]
+        ])
+    
+    def test_desde_estado(self):
+        rho = MatrizDensidad.desde_estado(self.bell)
+        self.assertEqual(rho.num_qubits, 2)
+        self.assertAlmostEqual(rho.pureza(), 1.0)
+        probs = rho.medir()
+        self.assertAlmostEqual(probs["0"], 0.5)
+        self.assertAlmostEqual(probs["3"], 0.5)
+        self.assertAlmostEqual(probs["1"], 0.0)
+    
+    def test_traza_no_unitaria(self):
+        with self.assertRaises(ValueError):
+            MatrizDensidad("rho", [[1, 0], [0, 1]])
+        with self.assertRaises(ValueError):
+            MatrizDensidad("rho", [[1, 0, 0], [0, 0, 0], [0, 0, 0]])
+    
+    def test_traza_parcial(self):
+        rho = MatrizDensidad.desde_estado(self.bell)
+        reducida = rho.traza_parcial([0])
+        self.assertAlmostEqual(reducida.matriz[0][0], 0.5)
+        self.assertAlmostEqual(reducida.matriz[1][1], 0.5)
+        self.assertAlmostEqual(reducida.matriz[0][1], 0)
+        self.assertAlmostEqual(reducida.pureza(), 0.5)
+        
+        # |0> ⊗ |1>: conservar el qubit 1 deja |1><1|
+        producto = MatrizDensidad.desde_estado(EstadoCuantico("q01", [0, 1, 0, 0]))
+        self.assertAlmostEqual(producto.traza_parcial([1]).medir()["1"], 1.0)
+        self.assertAlmostEqual(producto.traza_parcial([0]).medir()["0"], 1.0)
+    
+    def test_mezcla(self):
+        rho = MatrizDensidad.mezcla("mix", [EstadoCuantico("a", [1, 0]), EstadoCuantico("b", [0, 1])], [0.25, 0.75])
+        self.assertAlmostEqual(rho.medir()["1"], 0.75)
+        self.assertAlmostEqual(rho.pureza(), 0.25**2 + 0.75**2)
+    
+    def test_evolucion_unitaria(self):
+        # H en el qubit 0 y CNOT llevan |00><00| a la matriz densidad del estado de Bell
+        rho = MatrizDensidad.desde_estado(EstadoCuantico("q00", [1, 0, 0, 0]))
+        rho = crear_operador_h().aplicar_densidad(rho, qubits=[0])
+        rho = self.cnot.aplicar_densidad(rho)
+        esperada = MatrizDensidad.desde_estado(self.bell)
+        for fila, fila_esperada in zip(rho.matriz, esperada.matriz):
+            for c, c_esperado in zip(fila, fila_esperada):
+                self.assertAlmostEqual(c, c_esperado)
+        self.assertEqual(rho.id, "q00_H_CNOT")
+    
+    def test_evolucion_coincide_con_vector(self):
+        estado = EstadoCuantico("q", [0.6, 0, 0.8j, 0])
+        op_x = crear_operador_x()
+        rho = op_x.aplicar_densidad(MatrizDensidad.desde_estado(estado), qubits=[1])
+        esperada = MatrizDensidad.desde_estado(op_x.aplicar(estado, qubits=[1]))
+        for fila, fila_esperada in zip(rho.matriz, esperada.matriz):
+            for c, c_esperado in zip(fila, fila_esperada):
+                self.assertAlmostEqual(c, c_esperado)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from src.operador_cuantico import OperadorCuantico, crear_operador_x, crear_operador_h
 from src.estado_cuantico import EstadoCuantico
+from src.backends import backends_disponibles
 
 class TestOperadorCuantico(unittest.TestCase):
     def test_operador_x(self):
@@ -40,6 +41,81 @@ class TestOperadorCuantico(unittest.TestCase):
         estado = EstadoCuantico("q_err", [1, 0, 0])  # 3 componentes
         with self.assertRaises(ValueError):
             op.aplicar(estado)
+    
+    def test_aplicar_sobre_qubits(self):
+        op_x = crear_operador_x()
+        estado = EstadoCuantico("q00", [1, 0, 0, 0])
+        # El qubit 0 es el más significativo: X en el qubit 0 da |10>
+        self.assertEqual(op_x.aplicar(estado, qubits=[0]).vector, [0, 0, 1, 0])
+        self.assertEqual(op_x.aplicar(estado, qubits=[1]).vector, [0, 1, 0, 0])
+        
+        cnot = OperadorCuantico("CNOT", [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+        estado = EstadoCuantico("q100", [0, 0, 0, 0, 1, 0, 0, 0])
+        # Control en el qubit 0, objetivo en el qubit 2: |100> -> |101>
+        self.assertEqual(cnot.aplicar(estado, qubits=[0, 2]).vector.index(1), 5)
+        # Control en el qubit 2 (a 0): no cambia
+        self.assertEqual(cnot.aplicar(estado, qubits=[2, 0]).vector.index(1), 4)
+        
+        with self.assertRaises(ValueError):
+            op_x.aplicar(estado, qubits=[3])
+        with self.assertRaises(ValueError):
+            cnot.aplicar(estado, qubits=[1])
+    
+    def test_aplicar_en_sitio(self):
+        op_h = crear_operador_h()
+        estado = EstadoCuantico("q00", [1, 0, 0, 0])
+        vector = estado.vector
+        resultado = op_h.aplicar(estado, qubits=[1], en_sitio=True)
+        self.assertIs(resultado, estado)
+        self.assertIs(estado.vector, vector)
+        h = 1/2**0.5
+        for a, b in zip(estado.vector, [h, h, 0, 0]):
+            self.assertAlmostEqual(a, b)
+        
+        # Sin qubits actúa sobre todo el estado
+        estado = EstadoCuantico("q0", [1, 0])
+        crear_operador_x().aplicar(estado, en_sitio=True)
+        self.assertEqual(estado.vector, [0, 1])
+        
+        # Matriz completa de dimensión que no es potencia de 2, como en la ruta con copia
+        qutrit = EstadoCuantico("t", [1, 0, 0])
+        ciclo = OperadorCuantico("C", [[0, 0, 1], [1, 0, 0], [0, 1, 0]])
+        vector = qutrit.vector
+        ciclo.aplicar(qutrit, en_sitio=True)
+        self.assertIs(qutrit.vector, vector)
+        self.assertEqual(qutrit.vector, [0, 1, 0])
+        with self.assertRaises(ValueError):
+            crear_operador_x().aplicar(qutrit, en_sitio=True)
+    
+    def test_memoria_en_sitio(self):
+        import tracemalloc
+        n = 12
+        op_h = crear_operador_h()
+        
+        def pico(en_sitio, backend=None):
+            # Se traza desde el principio para que liberar amplitudes antiguas también cuente
+            tracemalloc.start()
+            vector = [0j] * (1 << n)
+            vector[0] = 1
+            estado = EstadoCuantico("q", vector)
+            # Superposición uniforme: todas las amplitudes pasan a ser objetos distintos
+            for q in range(n):
+                estado = op_h.aplicar(estado, qubits=[q], en_sitio=True)
+            actual, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            for q in range(n):
+                estado = op_h.aplicar(estado, qubits=[q], en_sitio=en_sitio, backend=backend)
+            _, maximo = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return maximo - actual
+        
+        pico_copia = pico(False)
+        # Cada copia reserva al menos una lista de 2^n punteros
+        self.assertGreater(pico_copia, 8 * (1 << n))
+        # Con listas, ningún backend debe reservar temporales de 2^n en el sitio
+        for nombre in backends_disponibles():
+            with self.subTest(backend=nombre):
+                self.assertLess(pico(True, nombre), pico_copia / 10)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -42,6 +42,23 @@ class TestRepositorioDeEstados(unittest.TestCase):
         
         # Verificar que hay dos estados ahora (original y transformado)
         self.assertEqual(len(self.repo.listar_estados()), 2)
+        
+        # Un nuevo_id existente no sobrescribe (evita ciclos en la procedencia)
+        with self.assertRaisesRegex(ValueError, "Ya existe"):
+            self.repo.aplicar_operador("q0_X", self.op_x, "q0")
+        self.assertEqual(self.repo.procedencia("q0")["padre"], None)
+        self.assertEqual(self.repo.obtener_estado("q0").vector, [1, 0])
+        
+        # En el sitio el estado conserva su ID: pedir otro es un error, no se ignora
+        with self.assertRaises(ValueError):
+            self.repo.aplicar_operador("q0", self.op_x, "otro", en_sitio=True)
+        self.assertEqual(self.repo.obtener_estado("q0").vector, [1, 0])
+        self.repo.aplicar_operador("q0", self.op_x, en_sitio=True)
+        self.assertEqual(self.repo.obtener_estado("q0").vector, [0, 1])
+        # La procedencia y el índice por cadena reflejan la transformación en el sitio
+        self.assertEqual(self.repo.procedencia("q0")["cadena"], ["X"])
+        self.assertEqual([e.id for e in self.repo.buscar(cadena=[])], [])
+        self.assertEqual([e.id for e in self.repo.buscar(cadena=["X"])], ["q0", "q0_X"])
     
     def test_medir_estado(self):
         self.repo.agregar_estado("q0", [1, 0])
@@ -75,5 +92,252 @@ class TestRepositorioDeEstados(unittest.TestCase):
             if os.path.exists(temp_filename):
                 os.unlink(temp_filename)
 
+    def test_agregar_estados_lote(self):
+        h = 1/2**0.5
+        self.repo.agregar_estados(["a", "b", "c"], [[1, 0], [0, 1], [h, h]])
+        self.assertEqual(len(self.repo.estados), 3)
+        self.assertAlmostEqual(self.repo.medir_estado("c")["1"], 0.5)
+        
+        ids, vectores = self.repo.exportar_estados()
+        self.assertEqual(ids, ["a", "b", "c"])
+        self.assertEqual(vectores[1], [0, 1])
+    
+    def test_agregar_estados_lote_atomico(self):
+        with self.assertRaises(ValueError):
+            self.repo.agregar_estados(["a", "b"], [[1, 0], [1, 1]])
+        with self.assertRaises(ValueError):
+            self.repo.agregar_estados(["a", "a"], [[1, 0], [0, 1]])
+        self.assertEqual(len(self.repo.estados), 0)
+    
+    def test_csv_ida_y_vuelta(self):
+        with tempfile.NamedTemporaryFile(mode='w+', suffix='.csv', delete=False) as tmp:
+            temp_filename = tmp.name
+        
+        try:
+            self.repo.agregar_estados(["a", "b"], [[1, 0], [0, 1j]])
+            self.repo.agregar_estado("c", [0, 0, 1, 0], "hadamard")
+            self.repo.exportar_csv(temp_filename)
+            
+            nuevo_repo = RepositorioDeEstados()
+            nuevo_repo.importar_csv(temp_filename)
+            self.assertEqual(nuevo_repo.obtener_estado("b").vector, [0, 1j])
+            self.assertEqual(nuevo_repo.obtener_estado("c").base, "hadamard")
+            self.assertEqual(len(nuevo_repo.obtener_estado("c").vector), 4)
+        finally:
+            if os.path.exists(temp_filename):
+                os.unlink(temp_filename)
+    
+    def test_npy_ida_y_vuelta(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy no está instalado")
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            archivo = os.path.join(tmpdir, "estados.npz")
+            amplitudes = np.zeros((1000, 4), dtype=np.complex128)
+            amplitudes[np.arange(1000), np.arange(1000) % 4] = 1
+            self.repo.agregar_estados([f"q{i}" for i in range(1000)], amplitudes)
+            self.repo.exportar_npy(archivo)
+            
+            nuevo_repo = RepositorioDeEstados()
+            nuevo_repo.importar_npy(archivo)
+            self.assertEqual(len(nuevo_repo.estados), 1000)
+            self.assertAlmostEqual(nuevo_repo.medir_estado("q7")["3"], 1.0)
+            
+            # Lote NumPy con una fila no normalizada: se rechaza entero
+            amplitudes[5, 0] = 1
+            with self.assertRaisesRegex(ValueError, "'r5' no está normalizado"):
+                nuevo_repo.agregar_estados([f"r{i}" for i in range(1000)], amplitudes)
+            self.assertEqual(len(nuevo_repo.estados), 1000)
+            
+            # Repositorio vacío
+            vacio = os.path.join(tmpdir, "vacio.npz")
+            RepositorioDeEstados().exportar_npy(vacio)
+            nuevo_repo = RepositorioDeEstados()
+            nuevo_repo.importar_npy(vacio)
+            self.assertEqual(len(nuevo_repo.estados), 0)
+
+    def test_valores_esperados_y_fidelidades(self):
+        from src.operador_cuantico import OperadorCuantico
+        self.repo.agregar_estados(["a", "b"], [[1, 0], [0, 1]])
+        op_z = OperadorCuantico("Zop", [[1, 0], [0, -1]])
+        valores = self.repo.valores_esperados(["a", "b"], ["Z", "X", op_z])
+        self.assertAlmostEqual(valores["a"]["Z"], 1.0)
+        self.assertAlmostEqual(valores["b"]["Z"], -1.0)
+        self.assertAlmostEqual(valores["b"]["X"], 0.0)
+        self.assertAlmostEqual(valores["b"]["Zop"], -1.0)
+        # Una cadena de Pauli y un operador con el mismo nombre no pueden compartir clave
+        with self.assertRaisesRegex(ValueError, "nombre repetido: Z"):
+            self.repo.valores_esperados(["a"], ["Z", OperadorCuantico("Z", [[0, 1], [1, 0]])])
+        # No se crean estados derivados
+        self.assertEqual(len(self.repo.estados), 2)
+        
+        self.assertEqual(self.repo.fidelidades("a"), {"a": 1.0, "b": 0.0})
+
+    def test_buscar_por_indices(self):
+        from src.operador_cuantico import crear_operador_h
+        op_h = crear_operador_h()
+        self.repo.agregar_estado("q0", [1, 0])
+        self.repo.agregar_estado("q1", [0, 1], "hadamard")
+        self.repo.agregar_estado("r", [1, 0, 0, 0])
+        self.repo.aplicar_operador("q0", op_h)
+        self.repo.aplicar_operador("q0_H", self.op_x)
+        self.repo.aplicar_operador("q0_H", self.op_x)
+        
+        ids = lambda estados: [e.id for e in estados]
+        self.assertEqual(ids(self.repo.buscar(num_qubits=2)), ["r"])
+        self.assertEqual(ids(self.repo.buscar(base="hadamard")), ["q1"])
+        self.assertEqual(ids(self.repo.buscar(origen="q0")), ["q0", "q0_H", "q0_H_X", "q0_H_X_1"])
+        self.assertEqual(sorted(ids(self.repo.buscar(derivado_de="q0_H"))), ["q0_H_X", "q0_H_X_1"])
+        self.assertEqual(ids(self.repo.buscar(cadena=["H", "X"], num_qubits=1)), ["q0_H_X", "q0_H_X_1"])
+        self.assertEqual(ids(self.repo.buscar(base="hadamard", origen="q0")), [])
+        self.assertEqual(len(self.repo.buscar()), 6)
+        
+        self.assertEqual(self.repo.procedencia("q0_H_X_1"),
+                         {"padre": "q0_H", "operador": "X", "origen": "q0", "cadena": ["H", "X"]})
+    
+    def test_indices_tras_cargar(self):
+        with tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False) as tmp:
+            temp_filename = tmp.name
+        
+        try:
+            self.repo.agregar_estado("q0", [1, 0])
+            self.repo.aplicar_operador("q0", self.op_x)
+            self.repo.aplicar_operador("q0", self.op_x, "otro")
+            self.repo.guardar(temp_filename)
+            
+            nuevo_repo = RepositorioDeEstados()
+            nuevo_repo.cargar(temp_filename)
+            self.assertEqual([e.id for e in nuevo_repo.buscar(derivado_de="q0")], ["q0_X", "otro"])
+        finally:
+            if os.path.exists(temp_filename):
+                os.unlink(temp_filename)
+    
+    def test_procedencia_desde_id_antiguo(self):
+        from src.repositorio import _procedencia_desde_id
+        ids = {"q0", "q0_H", "q0_H_X"}
+        self.assertEqual(_procedencia_desde_id("q0_H_X_2", ids), ("q0_H", "X"))
+        self.assertEqual(_procedencia_desde_id("q0_H_X", ids), ("q0_H", "X"))
+        self.assertEqual(_procedencia_desde_id("q0", ids), (None, None))
+
+    def test_listar_paginado(self):
+        self.repo.agregar_estados([f"q{i}" for i in range(25)], [[1, 0]] * 25)
+        pagina, cursor = self.repo.listar_pagina(tamano=10)
+        self.assertEqual(len(pagina), 10)
+        self.assertTrue(pagina[0].startswith("q0:"))
+        self.assertEqual(cursor, "q9")
+        
+        pagina, cursor = self.repo.listar_pagina(cursor, tamano=10)
+        self.assertTrue(pagina[0].startswith("q10:"))
+        pagina, cursor = self.repo.listar_pagina(cursor, tamano=10)
+        self.assertEqual(len(pagina), 5)
+        self.assertIsNone(cursor)
+        
+        with self.assertRaises(ValueError):
+            self.repo.listar_pagina("no_existe")
+        
+        iterador = self.repo.iterar_estados()
+        self.assertTrue(next(iterador).startswith("q0:"))
+        self.assertEqual(sum(1 for _ in iterador), 24)
+
+    def test_ids_automaticos_repetidos(self):
+        self.repo.agregar_estado("q0", [1, 0])
+        self.repo.agregar_estado("q0_X_2", [0, 1])  # ID ocupado por el usuario
+        ids = [self.repo.aplicar_operador("q0", self.op_x).id for _ in range(4)]
+        self.assertEqual(ids, ["q0_X", "q0_X_1", "q0_X_3", "q0_X_4"])
+    
+    def test_contadores_persistidos(self):
+        with tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False) as tmp:
+            temp_filename = tmp.name
+        
+        try:
+            self.repo.agregar_estado("q0", [1, 0])
+            for _ in range(3):
+                self.repo.aplicar_operador("q0", self.op_x)
+            self.repo.guardar(temp_filename)
+            
+            nuevo_repo = RepositorioDeEstados()
+            nuevo_repo.cargar(temp_filename)
+            self.assertEqual(nuevo_repo._contadores, {("q0", "X"): 3})
+            self.assertEqual(nuevo_repo.aplicar_operador("q0", self.op_x).id, "q0_X_3")
+        finally:
+            if os.path.exists(temp_filename):
+                os.unlink(temp_filename)
+    
+    def test_cargar_formato_antiguo(self):
+        import json
+        with tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False) as tmp:
+            json.dump([{"id": "q0", "vector": [1, 0], "base": "computacional"}], tmp)
+            temp_filename = tmp.name
+        
+        try:
+            self.repo.cargar(temp_filename)
+            self.assertEqual(len(self.repo.estados), 1)
+        finally:
+            os.unlink(temp_filename)
+    
+    def test_estres_ids_automaticos(self):
+        import time
+        self.repo.agregar_estado("q0", [1, 0])
+        inicio = time.perf_counter()
+        for _ in range(10**5):
+            nuevo = self.repo.aplicar_operador("q0", self.op_x)
+        duracion = time.perf_counter() - inicio
+        self.assertEqual(nuevo.id, f"q0_X_{10**5 - 1}")
+        # Con el sondeo lineal anterior esto tardaba minutos (coste cuadrático)
+        self.assertLess(duracion, 30)
+
+    def test_colapsar_estado(self):
+        h = 1/2**0.5
+        self.repo.agregar_estado("q+", [h, h])
+        resultado = self.repo.colapsar_estado("q+", semilla=42)
+        self.assertAlmostEqual(self.repo.medir_estado("q+")[resultado], 1.0)
+        with self.assertRaises(ValueError):
+            self.repo.colapsar_estado("no_existe")
+
+    def test_cambiar_base(self):
+        self.repo.agregar_estado("q0", [1, 0])
+        self.repo.agregar_estado("q1", [0, 1])
+        probs = self.repo.medir_estado("q1", "hadamard")
+        self.assertAlmostEqual(probs["1"], 0.5)
+        
+        estado = self.repo.cambiar_base("q1", "hadamard")
+        self.assertEqual(estado.base, "hadamard")
+        self.assertEqual([e.id for e in self.repo.buscar(base="hadamard")], ["q1"])
+        self.assertEqual([e.id for e in self.repo.buscar(base="computacional")], ["q0"])
+        self.repo.cambiar_base("q0", "hadamard")
+        self.assertNotIn("computacional", self.repo._por_base)
+        with self.assertRaises(ValueError):
+            self.repo.cambiar_base("q0", "ZZ")
+    
+    def test_persistencia_comprimida(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            archivo = os.path.join(tmpdir, "estados.json")
+            disperso = [0] * 4096
+            disperso[3] = 1
+            h = 1 / 2**6
+            self.repo.agregar_estado("q0", [1, 0])
+            self.repo.agregar_estado("disperso", disperso)
+            self.repo.agregar_estado("denso", [h] * 4096)
+            
+            self.repo.guardar(archivo, compresion=None)
+            tamano = os.path.getsize(archivo)
+            self.repo.guardar(archivo)
+            self.assertLess(os.path.getsize(archivo), tamano)
+            nuevo_repo = RepositorioDeEstados()
+            nuevo_repo.cargar(archivo)
+            self.assertEqual(nuevo_repo.obtener_estado("q0").vector, [1, 0])
+            self.assertEqual(nuevo_repo.obtener_estado("disperso").vector, disperso)
+            self.assertEqual(nuevo_repo.obtener_estado("denso").vector, [h] * 4096)
+            
+            self.repo.guardar(archivo, precision="complex64", compresion=None)
+            self.assertLess(os.path.getsize(archivo), tamano)
+            nuevo_repo.cargar(archivo)
+            self.assertAlmostEqual(nuevo_repo.obtener_estado("denso").vector[10], h)
+        
+        informe = self.repo.informe_almacenamiento("disperso")
+        self.assertTrue(all("bytes" in fila for fila in informe))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
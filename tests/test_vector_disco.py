@@ -0,0 +1,96 @@
+import unittest
+import math
+import random
+import tempfile
+from src.vector_disco import VectorEnDisco
+from src.estado_cuantico import EstadoCuantico
+from src.operador_cuantico import OperadorCuantico, crear_operador_h, crear_operador_x
+
+def estado_aleatorio(n, semilla):
+    generador = random.Random(semilla)
+    vector = [complex(generador.gauss(0, 1), generador.gauss(0, 1)) for _ in range(1 << n)]
+    norma = math.sqrt(sum(abs(a)**2 for a in vector))
+    return EstadoCuantico("psi", [a / norma for a in vector])
+
+class TestVectorEnDisco(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cnot = OperadorCuantico("CNOT", [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def assertVectoresIguales(self, a, b):
+        self.assertEqual(len(a), len(b))
+        for x, y in zip(a, b):
+            self.assertAlmostEqual(x, y)
+    
+    def test_crear_y_reabrir(self):
+        vector = VectorEnDisco.crear(self.tmpdir.name, 6, qubits_por_fragmento=3)
+        self.assertEqual(vector.num_fragmentos, 8)
+        self.assertAlmostEqual(vector.norma(), 1.0)
+        reabierto = VectorEnDisco(self.tmpdir.name)
+        self.assertEqual(reabierto.num_qubits, 6)
+        self.assertEqual(reabierto.mas_probables(3), {"0": 1.0})
+    
+    def test_puertas_coinciden_con_memoria(self):
+        estado = estado_aleatorio(5, semilla=1)
+        vector = VectorEnDisco.desde_estado(self.tmpdir.name, estado, qubits_por_fragmento=2)
+        # Qubits internos al fragmento, que seleccionan fragmento y mezclas de ambos
+        pasos = [(crear_operador_h(), [4]), (crear_operador_h(), [0]), (crear_operador_x(), [2]),
+                 (self.cnot, [0, 4]), (self.cnot, [3, 1]), (self.cnot, [0, 1])]
+        for operador, qubits in pasos:
+            estado = operador.aplicar(estado, qubits)
+            vector.aplicar_operador(operador, qubits)
+        self.assertVectoresIguales(vector.a_estado("psi").vector, estado.vector)
+    
+    def test_backend_vectorial_recibe_arrays(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy no está instalado")
+        from src.backends import BackendNumpy
+        
+        class Espia(BackendNumpy):
+            def aplicar_matriz_local_en_sitio(self, matriz, vector, qubits, n):
+                tipos.append((type(vector), vector.dtype))
+                super().aplicar_matriz_local_en_sitio(matriz, vector, qubits, n)
+        
+        tipos = []
+        estado = estado_aleatorio(5, semilla=4)
+        vector = VectorEnDisco.desde_estado(self.tmpdir.name, estado, qubits_por_fragmento=2)
+        for operador, qubits in [(crear_operador_h(), [0]), (self.cnot, [4, 1]), (crear_operador_x(), [3])]:
+            estado = operador.aplicar(estado, qubits)
+            vector.aplicar_operador(operador, qubits, backend=Espia())
+        self.assertTrue(tipos)
+        self.assertTrue(all(tipo == (np.ndarray, np.complex128) for tipo in tipos))
+        self.assertVectoresIguales(vector.a_estado("psi").vector, estado.vector)
+    
+    def test_medir_y_muestrear(self):
+        estado = estado_aleatorio(4, semilla=2)
+        vector = VectorEnDisco.desde_estado(self.tmpdir.name, estado, qubits_por_fragmento=2)
+        probs = estado.medir()
+        medidas = vector.medir([0, 1, 2, 3])
+        for clave in probs:
+            self.assertAlmostEqual(medidas[format(int(clave), "04b")], probs[clave])
+        with self.assertRaises(ValueError):
+            vector.medir([])
+        
+        marginal = vector.medir([0])
+        self.assertAlmostEqual(marginal["1"], sum(probs[str(i)] for i in range(8, 16)))
+        marginal = vector.medir([3, 0])
+        self.assertAlmostEqual(marginal["10"], sum(probs[str(i)] for i in range(1, 8, 2)))
+        
+        mejores = vector.mas_probables(3)
+        self.assertEqual(list(mejores), sorted(probs, key=probs.get, reverse=True)[:3])
+        for clave, prob in mejores.items():
+            self.assertAlmostEqual(prob, probs[clave])
+        
+        cuentas = vector.muestrear(4000, semilla=3)
+        self.assertEqual(sum(cuentas.values()), 4000)
+        for clave, prob in probs.items():
+            self.assertLess(abs(cuentas.get(clave, 0) / 4000 - prob), 0.05)
+        self.assertEqual(cuentas, vector.muestrear(4000, semilla=3))
+
+if __name__ == "__main__":
+    unittest.main()